@@ -25,12 +25,13 @@ import logging
 import re
 import sys
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import ClassVar, NotRequired, Self, TypedDict
 
+import numpy as np
 import pandas as pd
 import yaml
 
@@ -134,7 +135,7 @@ def get_data_type_by(value: str | None) -> DataType:
     return DataType.UNKNOWN
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Unit:
     """Represents a physical unit with conversion capabilities.
 
@@ -316,7 +317,7 @@ class Units:
         >>> length_units = Units.get_units_of(UnitType.LENGTH)
         >>> pressure_units = Units.get_units_of(UnitType.PRESSURE)
         """
-        return [unit for unit in cls.get_all_units() if unit.unit_type == unit_type]
+        return list(_UNITS_BY_TYPE.get(unit_type, ()))
 
     @classmethod
     def get_all_units(cls) -> list[Unit]:
@@ -332,15 +333,7 @@ class Units:
         >>> all_units = Units.get_all_units()
         >>> print(f"Total units available: {len(all_units)}")
         """
-        all_units = []
-        for attr_name in dir(cls):
-            if attr_name.startswith("_"):
-                continue
-            unit = getattr(cls, attr_name)
-            if not isinstance(unit, Unit):
-                continue
-            all_units.append(unit)
-        return all_units
+        return list(_ALL_UNITS)
 
     @classmethod
     def get_convertable_units(cls) -> list[Unit]:
@@ -358,7 +351,7 @@ class Units:
         >>> convertable = Units.get_convertable_units()
         >>> non_convertable = [u for u in Units.get_all_units() if not u.convertable]
         """
-        return [unit for unit in cls.get_all_units() if unit.is_convertable]
+        return list(_CONVERTABLE_UNITS)
 
     @classmethod
     def get_unit_by(cls, full_name: str) -> Unit | None:
@@ -379,9 +372,8 @@ class Units:
         >>> unit = Units.get_unit_by("length (mm)")
         >>> print(unit.symbol)  # "mm"
         """
-        for unit in cls.get_all_units():
-            if unit.full_name != full_name:
-                continue
+        unit = _UNIT_BY_FULL_NAME.get(full_name)
+        if unit is not None:
             return unit
         unit_type_name = full_name.split()[0]
         unit_type = get_unit_type_by(unit_type_name)
@@ -458,6 +450,26 @@ class Units:
     RADIAN = Unit("Radiant", "rad", UnitType.ANGLE, 57.2958)
 
 
+# The Units attributes never change at runtime, so the collections are
+# materialized once at import instead of scanning the class per call
+_ALL_UNITS: tuple[Unit, ...] = tuple(unit for unit in vars(Units).values() if isinstance(unit, Unit))
+_UNITS_BY_TYPE: dict[UnitType, tuple[Unit, ...]] = {
+    unit_type: tuple(unit for unit in _ALL_UNITS if unit.unit_type == unit_type) for unit_type in UnitType
+}
+_UNIT_BY_FULL_NAME: dict[str, Unit] = {unit.full_name: unit for unit in _ALL_UNITS}
+_CONVERTABLE_UNITS: tuple[Unit, ...] = tuple(unit for unit in _ALL_UNITS if unit.is_convertable)
+
+
+# Precompiled once so extract_unit does not hit the regex cache on every call
+_BRACKET_PATTERN = re.compile(r"\(([^)]+)\)")
+
+# Separators checked for unit suffixes like "length_mm"
+_SUFFIX_SEPARATORS = ("_", "-", ".", " ")
+
+# Empty/placeholder symbols plus ambiguous single characters
+_INVALID_UNIT_SYMBOLS = frozenset({"", "?", "~", "a", "k", "m", "g", "h", "s"})
+
+
 class PatternDict(TypedDict):
     pattern: str
     data_type: str
@@ -478,7 +490,7 @@ class Configuration:
     classifiers: dict[str, ClassifierDict]
 
 
-@dataclass
+@dataclass(slots=True)
 class DataTypeUnit:
     """Result of unit extraction with detailed metrics.
 
@@ -561,6 +573,36 @@ class PatternMatch:
         }
 
 
+class _ContextTrie:
+    """Multi-pattern substring matcher for context-mapping keys.
+
+    Finds every mapping key contained in a column name in a single pass
+    over the name instead of one ``in`` scan per key.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self._root: dict = {}
+        for key in keys:
+            node = self._root
+            for char in key:
+                node = node.setdefault(char, {})
+            node[""] = key  # Terminal marker carrying the complete key
+
+    def find_all(self, text: str) -> set[str]:
+        """Return all keys that occur as substrings of text."""
+        matches: set[str] = set()
+        for start in range(len(text)):
+            node = self._root
+            for char in text[start:]:
+                node = node.get(char)
+                if node is None:
+                    break
+                key = node.get("")
+                if key is not None:
+                    matches.add(key)
+        return matches
+
+
 class UnitExtractor:
     """Extract units from column names without iterating over values.
 
@@ -579,6 +621,7 @@ class UnitExtractor:
         self.direct_mappings: dict[str, Unit] = {}
         self.context_mappings: dict[str, UnitType] = {}
         self._load_defaults()
+        self._context_trie = _ContextTrie(self.context_mappings)
         self.context_cache: dict[str, Unit] = {}
         self._units_cache: dict[str, Unit] = {}
 
@@ -613,13 +656,10 @@ class UnitExtractor:
         bool
             True if the symbol is valid and unambiguous, False otherwise.
         """
-        # Exclude empty or problematic symbols
-        if symbol_key in ["", "?", "~"]:
-            return False
-
-        # Exclude ambiguous single characters
-        ambiguous_single_chars = ["a", "k", "m", "g", "h", "s"]
-        return symbol_key not in ambiguous_single_chars
+        # Multi-character symbols are never empty, placeholder or ambiguous
+        if len(symbol_key) > 1:
+            return True
+        return symbol_key not in _INVALID_UNIT_SYMBOLS
 
     def _load_direct_mapping(self, config: Configuration):
         """Load configuration and update direct mappings"""
@@ -646,6 +686,7 @@ class UnitExtractor:
                 continue
             mappings[value] = unit_type
         self.context_mappings.update(mappings)
+        self._context_trie = _ContextTrie(self.context_mappings)
 
     def load_configuration(self, config: Configuration):
         """Update mappings from given configuration
@@ -657,6 +698,8 @@ class UnitExtractor:
         """
         self._load_direct_mapping(config)
         self._load_context_mapping(config)
+        # Cached lookups were computed against the previous mappings
+        self.clear_cache()
 
     def _add_manual_mappings(self):
         """Add additional manual mappings."""
@@ -793,7 +836,7 @@ class UnitExtractor:
         name_lower = column_name.lower()
 
         # 1. Brackets: "Length (mm)"
-        bracket_match = re.search(r"\(([^)]+)\)", name_lower)
+        bracket_match = _BRACKET_PATTERN.search(name_lower)
         if bracket_match:
             unit_candidate = bracket_match.group(1).strip()
             if unit_candidate in self.direct_mappings:
@@ -802,13 +845,13 @@ class UnitExtractor:
                 return unit
 
         # 2. Column name "length_mm" -> "mm"
-        if column_name in self.direct_mappings:
-            unit = self.direct_mappings[column_name]
+        unit = self.direct_mappings.get(name_lower)
+        if unit is not None:
             self._units_cache[column_name] = unit
             return unit
 
         # 3. Suffix: "length_mm" -> "mm"
-        for sep in ["_", "-", ".", " "]:
+        for sep in _SUFFIX_SEPARATORS:
             if sep not in name_lower:
                 continue
             parts = name_lower.split(sep)
@@ -820,13 +863,15 @@ class UnitExtractor:
                 self._units_cache[column_name] = unit
                 return unit
 
-        # 4. Context: "length" -> "m"
-        for context, unit_type in self.context_mappings.items():
-            if context not in name_lower:
-                continue
-            unit = Units.one_unit_of(unit_type)
-            self._units_cache[column_name] = unit
-            return unit
+        # 4. Context: "length" -> "m" (single pass over the name via trie)
+        matched_contexts = self._context_trie.find_all(name_lower)
+        if matched_contexts:
+            for context, unit_type in self.context_mappings.items():
+                if context not in matched_contexts:
+                    continue
+                unit = Units.one_unit_of(unit_type)
+                self._units_cache[column_name] = unit
+                return unit
 
         self._units_cache[column_name] = Units.UNKNOWN
         return Units.UNKNOWN
@@ -917,17 +962,17 @@ class TypeInference:
                 numeric_result = pd.to_numeric(clean_series, errors="coerce")
                 if not isinstance(numeric_result, pd.Series):
                     raise TypeError("Numeric conversion failed.")
-                clean_numeric = numeric_result.notna()
-                success_ratio = clean_numeric.sum() / len(clean_series)
-                valid_numerics = numeric_result.dropna()
-
-                unique_types = _get_unique_type_of(valid_numerics)
+                # One coerced ndarray serves both threshold check and integer detection
+                coerced = numeric_result.to_numpy(dtype=np.float64, na_value=np.nan)
+                valid_mask = ~np.isnan(coerced)
+                success_ratio = valid_mask.sum() / len(clean_series)
+                valid_numerics = coerced[valid_mask]
 
                 # Decide based on success rate
                 if success_ratio >= self.numeric_threshold and len(valid_numerics) > 0:
                     # Check if we have nulls in original series
                     has_nulls = series.isna().any()
-                    all_integers = bool(valid_numerics.apply(lambda x: x % 1 == 0).all())
+                    all_integers = bool(np.all(np.mod(valid_numerics, 1.0) == 0.0))
 
                     # Logic:
                     # 1. If float64 dtype WITHOUT nulls → real floats → FLOAT
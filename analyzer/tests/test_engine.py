@@ -160,14 +160,14 @@ class TestDataClassificationEngine:
 
         # Nur General Classifier
         results = self.engine.analyze(df, active_classifiers=["General"])
-        assert all(r.classifier_name == "General" for r in results.values())
+        assert {r.classifier_name for r in results.values()} == {"General"}
 
         # Nur Architectural Classifier
         results = self.engine.analyze(df, active_classifiers=["Architectural"])
-        classifier_names = [r.classifier_name for r in results.values() if r.classifier_name != "Architectural"]
+        classifier_names = {r.classifier_name for r in results.values() if r.classifier_name != "Architectural"}
 
-        possible_classifiers = ("Architectural", "NO CLASSIFIER")
-        assert all(name in possible_classifiers for name in classifier_names), results
+        possible_classifiers = {"Architectural", "NO CLASSIFIER"}
+        assert classifier_names <= possible_classifiers, results
 
     def test_should_use_dataframe(self):
         """Test die _should_use_dataframe Entscheidungslogik."""
@@ -41,8 +41,7 @@ class TestUnitTypeEnum:
 
     def test_unit_type_count(self):
         """Test dass alle erwarteten UnitTypes vorhanden sind."""
-        unit_types = list(UnitType)
-        assert len(unit_types) == 19
+        assert len(UnitType) == 19
 
 
 class TestDataTypeEnum:
@@ -58,8 +57,7 @@ class TestDataTypeEnum:
 
     def test_data_type_count(self):
         """Test dass alle erwarteten DataTypes vorhanden sind."""
-        data_types = list(DataType)
-        assert len(data_types) == 5
+        assert len(DataType) == 5
 
 
 class TestIsUnitTypeConvertable:
@@ -2,7 +2,6 @@
 
 import json
 import sys
-import tempfile
 from pathlib import Path
 
 import pandas as pd
@@ -93,32 +92,28 @@ class TestAnalyzeData:
 
         results = analyze_data(df, active_classifiers=["General"])
 
-        assert all(r.classifier_name == "General" for r in results.values())
+        assert {r.classifier_name for r in results.values()} == {"General"}
 
-    def test_analyze_with_config_file(self):
+    def test_analyze_with_config_file(self, tmp_path):
         """Test Analyse mit Konfigurationsdatei."""
         # Erstelle temporäre Konfigurationsdatei
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            config = {
-                "direct_mappings": {"test_unit": "length (mm)"},
-                "context_mappings": {"test_context": "mass"},
-                "classifiers": {},
-            }
-            yaml.dump(config, f)
-            config_path = f.name
+        config = {
+            "direct_mappings": {"test_unit": "length (mm)"},
+            "context_mappings": {"test_context": "mass"},
+            "classifiers": {},
+        }
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(config), encoding="utf-8")
 
-        try:
-            df = pd.DataFrame({"test_unit": [1, 2, 3], "test_context": [10, 20, 30]})
+        df = pd.DataFrame({"test_unit": [1, 2, 3], "test_context": [10, 20, 30]})
 
-            results = analyze_data(df, config_path=config_path, merge_with_default=True)
+        results = analyze_data(df, config_path=config_path, merge_with_default=True)
 
-            assert len(results) == 2
-            # test_unit sollte als mm erkannt werden
-            assert results["test_unit"].unit.symbol == "mm"
-            # test_context sollte als Masse erkannt werden
-            assert results["test_context"].unit.unit_type == UnitType.MASS
-        finally:
-            Path(config_path).unlink()
+        assert len(results) == 2
+        # test_unit sollte als mm erkannt werden
+        assert results["test_unit"].unit.symbol == "mm"
+        # test_context sollte als Masse erkannt werden
+        assert results["test_context"].unit.unit_type == UnitType.MASS
 
     def test_analyze_empty_data(self):
         """Test mit leeren Daten."""
@@ -132,135 +127,111 @@ class TestAnalyzeData:
 class TestExportDefaultConfig:
     """Tests für die export_default_config Funktion."""
 
-    def test_export_yaml_format(self):
+    def test_export_yaml_format(self, tmp_path):
         """Test Export im YAML Format."""
-        with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as f:
-            output_path = f.name
-
-        try:
-            export_default_config(output_path, export_format="yaml")
+        output_path = tmp_path / "config.yaml"
 
-            assert Path(output_path).exists()
+        export_default_config(output_path, export_format="yaml")
 
-            # Lade und prüfe Inhalt
-            with open(output_path, "r") as f:
-                config = yaml.safe_load(f)
+        assert output_path.exists()
 
-            assert "direct_mappings" in config
-            assert "context_mappings" in config
-            assert "classifiers" in config
+        # Lade und prüfe Inhalt
+        with open(output_path, "r") as f:
+            config = yaml.safe_load(f)
 
-            # Prüfe dass Mappings vorhanden sind
-            assert len(config["direct_mappings"]) > 0
-            assert len(config["context_mappings"]) > 0
-            assert len(config["classifiers"]) >= 2  # General und Architectural
+        assert "direct_mappings" in config
+        assert "context_mappings" in config
+        assert "classifiers" in config
 
-            # Prüfe spezifische Einträge
-            assert "länge" in config["context_mappings"]
-            assert config["context_mappings"]["länge"] == "length"
+        # Prüfe dass Mappings vorhanden sind
+        assert len(config["direct_mappings"]) > 0
+        assert len(config["context_mappings"]) > 0
+        assert len(config["classifiers"]) >= 2  # General und Architectural
 
-            # Prüfe Klassifikatoren
-            assert "general" in config["classifiers"]
-            assert "architectural" in config["classifiers"]
+        # Prüfe spezifische Einträge
+        assert "länge" in config["context_mappings"]
+        assert config["context_mappings"]["länge"] == "length"
 
-            # Prüfe Struktur eines Klassifikators
-            general = config["classifiers"]["general"]
-            assert "name" in general
-            assert "priority" in general
-            assert "patterns" in general
-            assert len(general["patterns"]) > 0
+        # Prüfe Klassifikatoren
+        assert "general" in config["classifiers"]
+        assert "architectural" in config["classifiers"]
 
-        finally:
-            Path(output_path).unlink()
+        # Prüfe Struktur eines Klassifikators
+        general = config["classifiers"]["general"]
+        assert "name" in general
+        assert "priority" in general
+        assert "patterns" in general
+        assert len(general["patterns"]) > 0
 
-    def test_export_json_format(self):
+    def test_export_json_format(self, tmp_path):
         """Test Export im JSON Format."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            output_path = f.name
+        output_path = tmp_path / "config.json"
 
-        try:
-            export_default_config(output_path, export_format="json")
+        export_default_config(output_path, export_format="json")
 
-            assert Path(output_path).exists()
+        assert output_path.exists()
 
-            # Lade und prüfe Inhalt
-            with open(output_path, "r") as f:
-                config = json.load(f)
+        # Lade und prüfe Inhalt
+        with open(output_path, "r") as f:
+            config = json.load(f)
 
-            assert "direct_mappings" in config
-            assert "context_mappings" in config
-            assert "classifiers" in config
+        assert "direct_mappings" in config
+        assert "context_mappings" in config
+        assert "classifiers" in config
 
-            # Prüfe dass Inhalte vorhanden sind
-            assert isinstance(config["direct_mappings"], dict)
-            assert isinstance(config["context_mappings"], dict)
-            assert isinstance(config["classifiers"], dict)
+        # Prüfe dass Inhalte vorhanden sind
+        assert isinstance(config["direct_mappings"], dict)
+        assert isinstance(config["context_mappings"], dict)
+        assert isinstance(config["classifiers"], dict)
 
-        finally:
-            Path(output_path).unlink()
-
-    def test_export_invalid_format(self):
+    def test_export_invalid_format(self, tmp_path):
         """Test Export mit ungültigem Format."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            output_path = f.name
+        output_path = tmp_path / "config.txt"
 
-        try:
-            with pytest.raises(ValueError):
-                export_default_config(output_path, export_format="invalid")
-        finally:
-            Path(output_path).unlink(missing_ok=True)
+        with pytest.raises(ValueError):
+            export_default_config(output_path, export_format="invalid")
 
-    def test_export_does_not_include_automatic_symbols(self):
+    def test_export_does_not_include_automatic_symbols(self, tmp_path):
         """Test dass automatische Symbole nicht exportiert werden."""
-        with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as f:
-            output_path = f.name
-
-        try:
-            export_default_config(output_path)
+        output_path = tmp_path / "config.yaml"
 
-            with open(output_path, "r") as f:
-                config = yaml.safe_load(f)
+        export_default_config(output_path)
 
-            # Automatische Symbole wie "mm", "kg" sollten nicht in direct_mappings sein
-            # da sie automatisch aus Units geladen werden
-            # Nur manuelle Alternativen wie "millimeter", "kilogramm" sollten da sein
-            direct_mappings = config["direct_mappings"]
+        with open(output_path, "r") as f:
+            config = yaml.safe_load(f)
 
-            # Diese sind manuelle Mappings und sollten vorhanden sein
-            assert "millimeter" in direct_mappings or "meter" in direct_mappings
+        # Automatische Symbole wie "mm", "kg" sollten nicht in direct_mappings sein
+        # da sie automatisch aus Units geladen werden
+        # Nur manuelle Alternativen wie "millimeter", "kilogramm" sollten da sein
+        direct_mappings = config["direct_mappings"]
 
-        finally:
-            Path(output_path).unlink()
+        # Diese sind manuelle Mappings und sollten vorhanden sein
+        assert "millimeter" in direct_mappings or "meter" in direct_mappings
 
-    def test_export_classifier_patterns(self):
+    def test_export_classifier_patterns(self, tmp_path):
         """Test dass Classifier Patterns korrekt exportiert werden."""
-        with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as f:
-            output_path = f.name
-
-        try:
-            export_default_config(output_path)
+        output_path = tmp_path / "config.yaml"
 
-            with open(output_path, "r") as f:
-                config = yaml.safe_load(f)
+        export_default_config(output_path)
 
-            # Prüfe General Classifier Patterns
-            general_patterns = config["classifiers"]["general"]["patterns"]
-            assert len(general_patterns) > 0
+        with open(output_path, "r") as f:
+            config = yaml.safe_load(f)
 
-            # Prüfe Struktur eines Patterns
-            first_pattern = general_patterns[0]
-            assert "pattern" in first_pattern
-            assert "data_type" in first_pattern
-            # unit ist optional
+        # Prüfe General Classifier Patterns
+        general_patterns = config["classifiers"]["general"]["patterns"]
+        assert len(general_patterns) > 0
 
-            # Prüfe dass verschiedene Pattern-Typen vorhanden sind
-            pattern_strings = [p["pattern"] for p in general_patterns]
+        # Prüfe Struktur eines Patterns
+        first_pattern = general_patterns[0]
+        assert "pattern" in first_pattern
+        assert "data_type" in first_pattern
+        # unit ist optional
 
-            # Sollte Boolean-Patterns enthalten
-            assert any("boolean" in p or "aktiv" in p for p in pattern_strings)
+        # Prüfe dass verschiedene Pattern-Typen vorhanden sind
+        pattern_strings = [p["pattern"] for p in general_patterns]
 
-            # Sollte Length-Patterns enthalten
-            assert any("length" in p or "länge" in p for p in pattern_strings)
+        # Sollte Boolean-Patterns enthalten
+        assert any("boolean" in p or "aktiv" in p for p in pattern_strings)
 
-        finally:
-            Path(output_path).unlink()
+        # Sollte Length-Patterns enthalten
+        assert any("length" in p or "länge" in p for p in pattern_strings)
@@ -71,10 +71,16 @@ class TestUnits:
         all_units = Units.get_all_units()
 
         assert len(all_units) > 0
-        assert all(isinstance(unit, Unit) for unit in all_units)
+
+        # Baue Typ- und Symbol-Mengen in einem Durchlauf auf
+        unit_types: set[UnitType] = set()
+        symbols: set[str] = set()
+        for unit in all_units:
+            assert isinstance(unit, Unit)
+            unit_types.add(unit.unit_type)
+            symbols.add(unit.symbol)
 
         # Prüfe dass verschiedene Unit-Typen enthalten sind
-        unit_types = set(unit.unit_type for unit in all_units)
         assert UnitType.LENGTH in unit_types
         assert UnitType.AREA in unit_types
         assert UnitType.VOLUME in unit_types
@@ -84,7 +90,6 @@ class TestUnits:
         assert UnitType.UNKNOWN in unit_types
 
         # Prüfe dass spezifische Units enthalten sind
-        symbols = [unit.symbol for unit in all_units]
         assert "mm" in symbols
         assert "kg" in symbols
         assert "l" in symbols
@@ -98,7 +103,7 @@ class TestUnits:
         assert all(unit.is_convertable for unit in convertable)
 
         # Prüfe dass NONE und UNKNOWN nicht enthalten sind
-        symbols = [unit.symbol for unit in convertable]
+        symbols = {unit.symbol for unit in convertable}
         assert "" not in symbols  # NONE hat leeres Symbol
         assert "?" not in symbols  # UNKNOWN hat ? als Symbol
 
@@ -145,7 +150,7 @@ class TestUnits:
     def test_unit_types_coverage(self):
         """Test dass Units für verschiedene UnitTypes definiert sind."""
         all_units = Units.get_all_units()
-        covered_types = set(unit.unit_type for unit in all_units)
+        covered_types = {unit.unit_type for unit in all_units}
 
         expected_types = {
             UnitType.NONE,
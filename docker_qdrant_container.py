@@ -1,74 +1,80 @@
-import argparse
 import json
+import os
+import select
 import subprocess
 import sys
 import time
 from pathlib import Path
 
-import requests
-
 DOCKER_IMAGE = "qdrant/qdrant:latest"
 CONTAINER_NAME = "qdrant-indexer"
 
+QDRANT_DIR = Path.home() / ".config" / "claude-indexer"
+STORAGE_DIR = QDRANT_DIR / "qdrant_storage"
+
 
 def log_message(message):
     """Log to stderr (wird nicht an Claude gesendet)"""
     print(f"[Qdrant Hook] {message}", file=sys.stderr)
 
 
-def check_qdrant_running():
-    """Prüft ob Qdrant Container läuft"""
-    try:
-        result = subprocess.run(["docker", "ps", "--format", "{{.Names}}"], capture_output=True, text=True, check=True)
-        return CONTAINER_NAME in result.stdout
-    except subprocess.CalledProcessError:
-        return False
-
-
-def check_container_exists():
-    """Prüft ob der Container existiert (läuft oder gestoppt)"""
+def query_container_state():
+    """Liefert (existiert, läuft) mit einem einzigen docker-Aufruf"""
     try:
         result = subprocess.run(
-            ["docker", "ps", "-a", "--format", "{{.Names}}"],
+            ["docker", "ps", "-a", "--filter", f"name=^{CONTAINER_NAME}$", "--format", "{{.State}}"],
             capture_output=True,
             text=True,
-            check=True
+            check=True,
         )
-        return CONTAINER_NAME in result.stdout
     except subprocess.CalledProcessError:
-        return False
+        return False, False
+    state = result.stdout.strip()
+    return bool(state), state == "running"
+
+
+def check_qdrant_running():
+    """Prüft ob Qdrant Container läuft"""
+    return query_container_state()[1]
+
+
+def check_container_exists():
+    """Prüft ob der Container existiert (läuft oder gestoppt)"""
+    return query_container_state()[0]
 
 
 def start_existing_container():
     """Startet einen existierenden Container"""
     try:
-        result = subprocess.run(
+        # stdout wird nie gelesen, nur stderr im Fehlerfall
+        subprocess.run(
             ["docker", "start", CONTAINER_NAME],
-            capture_output=True,
-            text=True,
-            check=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True,
         )
         log_message(f"Started existing container: {CONTAINER_NAME}")
         return True
     except subprocess.CalledProcessError as e:
-        log_message(f"Failed to start existing container: {e.stderr}")
+        log_message(f"Failed to start existing container: {e.stderr.decode()}")
         return False
 
 
 def stop_container():
     """Stoppt den Container sauber"""
     try:
-        result = subprocess.run(
+        # stdout wird nie gelesen, nur stderr im Fehlerfall
+        subprocess.run(
             ["docker", "stop", CONTAINER_NAME],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=True,
-            timeout=10
+            timeout=10,
         )
         log_message(f"Stopped container: {CONTAINER_NAME}")
         return True
     except subprocess.CalledProcessError as e:
-        log_message(f"Failed to stop container: {e.stderr}")
+        log_message(f"Failed to stop container: {e.stderr.decode()}")
         return False
     except subprocess.TimeoutExpired:
         log_message("Container stop timed out")
@@ -81,20 +87,20 @@ def remove_container():
         # Stoppe zuerst den Container falls er läuft
         subprocess.run(
             ["docker", "stop", CONTAINER_NAME],
-            capture_output=True,
-            text=True,
-            timeout=5
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=5,
         )
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         pass  # Container ist bereits gestoppt oder existiert nicht
-    
+
     try:
         # Entferne den Container
-        result = subprocess.run(
+        subprocess.run(
             ["docker", "rm", CONTAINER_NAME],
-            capture_output=True,
-            text=True,
-            check=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
         )
         log_message(f"Removed container: {CONTAINER_NAME}")
         return True
@@ -104,22 +110,27 @@ def remove_container():
 
 def get_container_status():
     """Gibt den Status des Containers zurück"""
-    if check_qdrant_running():
+    exists, running = query_container_state()
+    if running:
         if check_qdrant_health():
             return "running_healthy"
         else:
             return "running_unhealthy"
-    elif check_container_exists():
+    elif exists:
         return "stopped"
     else:
         return "not_exists"
 
 
-def check_qdrant_health():
+def check_qdrant_health(session=None):
     """Prüft ob Qdrant API verfügbar ist"""
+    # Lazy-Import: stop/remove-Pfade brauchen requests nie
+    import requests
+
+    http = session if session is not None else requests
     try:
         # Qdrant nutzt Root-Endpoint statt /health
-        response = requests.get("http://localhost:6333/", timeout=2)
+        response = http.get("http://localhost:6333/", timeout=2)
         # Prüfe ob die Response JSON mit "title": "qdrant" enthält
         if response.status_code == 200:
             data = response.json()
@@ -134,12 +145,8 @@ def check_qdrant_health():
 
 def create_new_container():
     """Erstellt und startet einen neuen Qdrant Container detached"""
-    qdrant_dir = Path.home() / ".config" / "claude-indexer"
-    if not qdrant_dir.exists():
-        qdrant_dir.mkdir(parents=True, exist_ok=True)
-        log_message(f"Created directory: {qdrant_dir}")
-
-    storage_dir = qdrant_dir / "qdrant_storage"
+    # exist_ok erspart den separaten exists()-Check vor dem Anlegen
+    QDRANT_DIR.mkdir(parents=True, exist_ok=True)
 
     cmd = [
         "docker",
@@ -152,7 +159,7 @@ def create_new_container():
         "-p",
         "6334:6334",
         "-v",
-        f"{storage_dir}:/qdrant/storage:z",
+        f"{STORAGE_DIR}:/qdrant/storage:z",
         "--restart",
         "unless-stopped",  # Automatisch neustarten außer manuell gestoppt
         DOCKER_IMAGE,
@@ -167,15 +174,21 @@ def create_new_container():
         return False
 
 
-def ensure_qdrant_running():
-    """Stellt sicher dass Qdrant Container läuft"""
+def ensure_qdrant_running(state=None):
+    """Stellt sicher dass Qdrant Container läuft
+
+    state: optional vorab abgefragtes (existiert, läuft) Tupel, damit
+    Aufrufer ihre query_container_state-Antwort wiederverwenden können.
+    """
+    exists, running = state if state is not None else query_container_state()
+
     # Prüfe ob Container bereits läuft
-    if check_qdrant_running():
+    if running:
         log_message("Container already running")
         return True
-    
+
     # Prüfe ob Container existiert (aber gestoppt ist)
-    if check_container_exists():
+    if exists:
         log_message("Container exists but stopped, starting...")
         if start_existing_container():
             return True
@@ -191,24 +204,67 @@ def ensure_qdrant_running():
 
 
 def wait_for_qdrant(max_wait=30):
-    """Wartet bis Qdrant API verfügbar ist"""
-    for i in range(max_wait):
-        if check_qdrant_health():
-            log_message(f"Qdrant ready after {i + 1} seconds")
-            return True
-        time.sleep(1)
+    """Wartet bis Qdrant API verfügbar ist
+
+    Abonniert docker events, um beim Container-Start sofort aufzuwachen;
+    ohne Events wird höchstens einmal pro Sekunde per HTTP geprüft.
+    """
+    start = time.monotonic()
+    deadline = start + max_wait
+    # Lazy-Import: stop/remove-Pfade brauchen requests nie
+    import requests
+
+    # Eine Session hält die TCP-Verbindung über alle Probes offen
+    session = requests.Session()
+    events = _subscribe_container_events()
+    try:
+        while time.monotonic() < deadline:
+            if check_qdrant_health(session):
+                log_message(f"Qdrant ready after {time.monotonic() - start:.1f} seconds")
+                return True
+            # remaining kann nach einem langsamen Health-Probe negativ
+            # sein; select verlangt ein nicht-negatives Timeout
+            remaining = deadline - time.monotonic()
+            if events is not None and events.stdout is not None and os.name == "posix":
+                # Exakt aufwachen sobald ein Container-Event eintrifft;
+                # select auf Pipes funktioniert nur unter POSIX
+                ready, _, _ = select.select([events.stdout], [], [], min(1.0, max(remaining, 0.0)))
+                if ready:
+                    events.stdout.readline()
+            else:
+                time.sleep(min(1.0, max(remaining, 0.05)))
+    finally:
+        session.close()
+        if events is not None:
+            events.kill()
     return False
 
 
+def _subscribe_container_events():
+    """Startet eine docker-events-Subscription für den Container (oder None)"""
+    try:
+        return subprocess.Popen(
+            ["docker", "events", "--filter", f"container={CONTAINER_NAME}", "--format", "{{.Status}}"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError:
+        return None
+
+
 def handle_start():
     """Behandelt den Start-Modus"""
+    # Ein docker-Aufruf deckt alle Prüfungen in diesem Handler ab
+    state = query_container_state()
+
     # Prüfe ob Qdrant bereits läuft und bereit ist
-    if check_qdrant_running() and check_qdrant_health():
+    if state[1] and check_qdrant_health():
         print(json.dumps({"status": "ready", "message": "Qdrant already running", "url": "http://localhost:6333"}))
         return 0
 
     # Stelle sicher dass Container läuft (startet oder erstellt ihn)
-    if not ensure_qdrant_running():
+    if not ensure_qdrant_running(state):
         log_message("Failed to ensure Qdrant is running")
         print(json.dumps({"status": "error", "message": "Failed to start Qdrant container"}))
         return 1
@@ -238,11 +294,12 @@ def handle_start():
 
 def handle_stop():
     """Behandelt den Stop-Modus"""
-    if not check_container_exists():
+    exists, running = query_container_state()
+    if not exists:
         print(json.dumps({"status": "not_found", "message": "Container does not exist"}))
         return 1
-    
-    if not check_qdrant_running():
+
+    if not running:
         print(json.dumps({"status": "already_stopped", "message": "Container is already stopped"}))
         return 0
     
@@ -268,50 +325,53 @@ def handle_remove():
         return 1
 
 
+# Die Status-Antworten sind konstant und werden einmal serialisiert
+_STATUS_RESPONSES = {
+    "running_healthy": {
+        "status": "running",
+        "message": "Container is running and healthy",
+        "url": "http://localhost:6333",
+    },
+    "running_unhealthy": {"status": "unhealthy", "message": "Container is running but API not responding"},
+    "stopped": {"status": "stopped", "message": "Container exists but is stopped"},
+    "not_exists": {"status": "not_found", "message": "Container does not exist"},
+    "unknown": {"status": "unknown", "message": "Unknown status"},
+}
+_STATUS_RESPONSES_JSON = {key: (json.dumps(value) + "\n").encode() for key, value in _STATUS_RESPONSES.items()}
+
+
 def handle_status():
     """Behandelt den Status-Modus"""
     status = get_container_status()
-    
-    status_messages = {
-        "running_healthy": {"status": "running", "message": "Container is running and healthy", "url": "http://localhost:6333"},
-        "running_unhealthy": {"status": "unhealthy", "message": "Container is running but API not responding"},
-        "stopped": {"status": "stopped", "message": "Container exists but is stopped"},
-        "not_exists": {"status": "not_found", "message": "Container does not exist"}
-    }
-    
-    print(json.dumps(status_messages.get(status, {"status": "unknown", "message": "Unknown status"})))
+
+    response = _STATUS_RESPONSES_JSON.get(status, _STATUS_RESPONSES_JSON["unknown"])
+    sys.stdout.buffer.write(response)
+    sys.stdout.buffer.flush()
     return 0
 
 
 def main():
-    # Argument Parser einrichten
-    parser = argparse.ArgumentParser(description="Manage Qdrant Docker container")
-    parser.add_argument("--stop", action="store_true", help="Stop the Qdrant container")
-    parser.add_argument("--remove", action="store_true", help="Stop and remove the Qdrant container")
-    parser.add_argument("--status", action="store_true", help="Check container status")
-    
-    args = parser.parse_args()
-    
-    # Bei Claude Hook-Aufruf ohne Argumente: Session-Daten lesen
-    if not (args.stop or args.remove or args.status):
-        try:
-            # Session-Daten von stdin lesen (optional)
-            if not sys.stdin.isatty():
-                session_data = json.load(sys.stdin)
-                log_message(f"Session started from: {session_data.get('source', 'unknown')}")
-        except json.JSONDecodeError:
-            log_message("Session started (no JSON data)")
-    
-    # Modus auswählen und ausführen
-    if args.stop:
+    # Drei boolesche Flags brauchen keinen argparse-Import im Hook-Hot-Path
+    args = set(sys.argv[1:])
+
+    if "--stop" in args:
         return handle_stop()
-    elif args.remove:
+    if "--remove" in args:
         return handle_remove()
-    elif args.status:
+    if "--status" in args:
         return handle_status()
-    else:
-        # Standard: Container starten
-        return handle_start()
+
+    # Bei Claude Hook-Aufruf ohne Argumente: Session-Daten lesen
+    try:
+        # Session-Daten von stdin lesen (optional)
+        if not sys.stdin.isatty():
+            session_data = json.load(sys.stdin)
+            log_message(f"Session started from: {session_data.get('source', 'unknown')}")
+    except json.JSONDecodeError:
+        log_message("Session started (no JSON data)")
+
+    # Standard: Container starten
+    return handle_start()
 
 
 if __name__ == "__main__":
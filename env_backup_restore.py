@@ -8,31 +8,80 @@ import json
 import os
 import subprocess
 import sys
+import tempfile
+import urllib.error
+import urllib.request
 from pathlib import Path
 from typing import Any
 
 import click
 
+try:  # orjson serializes in C and returns one bytes buffer
+    import orjson
+except ImportError:
+    orjson = None
+
 GLOBAL_IGNORE_URL = (
     "https://raw.githubusercontent.com/eraschle/python-utils/refs/heads/master/env_backup_global_ignore.txt"
 )
 
+GLOBAL_IGNORE_CACHE = Path.home() / ".cache" / "env_backup" / "ignore.txt"
+GLOBAL_IGNORE_ETAG = GLOBAL_IGNORE_CACHE.with_suffix(".etag")
+
+
+def _read_cached_ignore_list() -> frozenset[str]:
+    try:
+        return frozenset(GLOBAL_IGNORE_CACHE.read_text(encoding="utf-8").lower().splitlines())
+    except OSError:
+        return frozenset()
+
 
-def get_global_ignore_list(fetch_url: str) -> tuple:
+def _write_ignore_cache(content: str, etag: str) -> None:
+    try:
+        GLOBAL_IGNORE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = GLOBAL_IGNORE_CACHE.with_suffix(".tmp")
+        tmp_file.write_text(content, encoding="utf-8")
+        os.replace(tmp_file, GLOBAL_IGNORE_CACHE)
+        if etag:
+            GLOBAL_IGNORE_ETAG.write_text(etag, encoding="utf-8")
+    except OSError:
+        pass  # The cache is best-effort; fetching still succeeded
+
+
+def get_global_ignore_list(fetch_url: str) -> frozenset[str]:
     """Fetches the global ignore list from a URL.
 
+    A cached copy under ~/.cache/env_backup is revalidated with the
+    server's ETag, so unchanged lists are answered with 304 and read
+    locally instead of re-downloaded.
+
     Params:
     fetch_url (str): URL to fetch the global ignore list from.
 
     Returns:
-    set: A set of environment variable names to ignore (case-insensitive).
+    frozenset: Lowercased environment variable names to ignore.
     """
+    headers = {}
+    if GLOBAL_IGNORE_ETAG.exists() and GLOBAL_IGNORE_CACHE.exists():
+        try:
+            headers["If-None-Match"] = GLOBAL_IGNORE_ETAG.read_text(encoding="utf-8").strip()
+        except OSError:
+            pass
+
+    request = urllib.request.Request(fetch_url, headers=headers)
     try:
-        response = subprocess.run(["curl", "-s", fetch_url], capture_output=True, text=True, check=True)
-        return tuple(set(response.stdout.splitlines()))
-    except subprocess.CalledProcessError as e:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            content = response.read().decode("utf-8")
+            etag = response.headers.get("ETag", "")
+        _write_ignore_cache(content, etag)
+        return frozenset(content.lower().splitlines())
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return _read_cached_ignore_list()
         print(f"Error fetching global ignore list: {e}", file=sys.stderr)
-        return tuple()
+    except (urllib.error.URLError, OSError) as e:
+        print(f"Error fetching global ignore list: {e}", file=sys.stderr)
+    return _read_cached_ignore_list()
 
 
 def save_environment_variables(env_vars: dict[str, str], env_file: str) -> None:
@@ -42,9 +91,17 @@ def save_environment_variables(env_vars: dict[str, str], env_file: str) -> None:
     env_vars (dict): Environment variables to save.
     env_file (str): Path to the JSON file for storing environment variables.
     """
+    # Erst in eine Temp-Datei schreiben, dann atomar ersetzen: ein
+    # abgebrochener Lauf hinterlässt so nie ein kaputtes Backup.
+    tmp_file = f"{env_file}.tmp"
     try:
-        with open(env_file, "w", encoding="utf-8") as f:  # open file for writing
-            json.dump(env_vars, f, indent=2, sort_keys=True)
+        if orjson is not None:
+            data = orjson.dumps(env_vars, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+            Path(tmp_file).write_bytes(data)
+        else:
+            with open(tmp_file, "w", encoding="utf-8") as f:  # open file for writing
+                json.dump(env_vars, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, env_file)
     except IOError as e:
         print(
             f"Error: Could not write to file {env_file}. Check permissions or path.",
@@ -67,12 +124,15 @@ def load_environment_variables(env_file: Path) -> dict[str, str] | None:
     dict: Loaded environment variables.
     """
     try:
+        if orjson is not None:
+            return orjson.loads(Path(env_file).read_bytes())
         with open(env_file, "r", encoding="utf-8") as file:
             return json.load(file)
     except FileNotFoundError:
         print(f"Error: File not found: {env_file}", file=sys.stderr)
         return None
-    except json.JSONDecodeError:
+    except ValueError:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError
         print(f"Error: Could not decode JSON from file: {env_file}", file=sys.stderr)
         return None
     except IOError as e:
@@ -80,15 +140,13 @@ def load_environment_variables(env_file: Path) -> dict[str, str] | None:
         return None
 
 
-def _backup_env_vars(env_to_ignore: tuple) -> dict[str, str]:
-    """Filters environment variables based on 1Password values and the ignore list."""
+def _backup_env_vars(env_to_ignore: frozenset[str]) -> dict[str, str]:
+    """Filters environment variables based on the lowercased ignore set."""
     vars_to_store: dict[str, str] = {}
-    ignored_names = []
 
-    to_ignore = {str(var).lower() for var in env_to_ignore}
-    for key, value in os.environ.items():
-        if key.lower() in to_ignore:
-            ignored_names.append(key)
+    # One snapshot instead of per-access getenv round-trips in the loop
+    for key, value in list(os.environ.items()):
+        if key.lower() in env_to_ignore:
             continue
 
         vars_to_store[key] = value
@@ -134,11 +192,14 @@ def backup(env_file: str, ignore: tuple, url: str, no_global_ignore: bool) -> No
     url (str): [Optional] URL to fetch the global ignore list. (default: URL of global ignore list from GitHub)
     no_global_ignore (bool): [Optional] Disable the global ignore list (default: False).
     """
-    if not no_global_ignore:
-        global_ignore = get_global_ignore_list(url)
-        ignore = ignore + tuple(global_ignore)
     print(f"Backup environment variables to {env_file}")
-    vars_to_store = _backup_env_vars(env_to_ignore=ignore)
+    # Lowercase once; the backup loop then only does frozenset probes
+    to_ignore = frozenset(str(var).lower() for var in ignore)
+    if not no_global_ignore:
+        # Die globale Liste ist bereits lowercased; eine Vereinigung statt
+        # Tuple-Konkatenation plus erneutem Set-Aufbau
+        to_ignore |= get_global_ignore_list(url)
+    vars_to_store = _backup_env_vars(env_to_ignore=to_ignore)
     count_env_vars = len(os.environ)
     count_ignored = count_env_vars - len(vars_to_store)
     print(f"- Total:   {count_env_vars}")
@@ -152,33 +213,49 @@ def set_envvar_linux(env_name: str, value: Any) -> int:
     return 0
 
 
-def set_envvar_windows(env_name: str, value: Any) -> int:
-    command = f'setx {env_name} "{value}"'
-    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    return process.wait()
+def set_envvars_windows(env_vars: list[tuple[str, Any]]) -> int:
+    """Sets all variables with a single cmd.exe child instead of one setx process each."""
+    if not env_vars:
+        return 0
+    with tempfile.NamedTemporaryFile("w", suffix=".bat", delete=False, encoding="utf-8") as script:
+        script.write("@echo off\n")
+        for env_name, value in env_vars:
+            script.write(f'setx {env_name} "{value}"\n')
+        script_path = script.name
+    try:
+        return subprocess.run(["cmd", "/c", script_path], check=False).returncode
+    finally:
+        os.unlink(script_path)
 
 
-def set_environment_variable(env_name: str, value: Any) -> None:
-    """ "Set an environment variable in the current session and system-wide.
+def set_environment_variables(env_vars: list[tuple[str, Any]]) -> None:
+    """Set environment variables in the current session and system-wide.
 
     Params:
-    env_name (str): Name of the environment variable.
-    value (Any): Value of the environment variable.
+    env_vars (list): (name, value) pairs to set.
     """
-    try:
+    # Eine gesammelte Ausgabe statt einem write()-Syscall pro Variable
+    out: list[str] = []
+    for env_name, value in env_vars:
         if env_name in os.environ:
-            print(f"Updating existing variable {env_name} from {os.environ[env_name]} to {value}")
+            out.append(f"Updating existing variable {env_name} from {os.environ[env_name]} to {value}\n")
         else:
-            print(f"Creating new variable {env_name} with value {value}")
+            out.append(f"Creating new variable {env_name} with value {value}\n")
+    sys.stdout.write("".join(out))
+    try:
         if sys.platform == "win32":
-            set_envvar_windows(env_name, value)
+            returncode = set_envvars_windows(env_vars)
+            if returncode != 0:
+                print(f"Error setting variables via setx (exit code {returncode})", file=sys.stderr)
+                sys.exit(1)
         elif sys.platform == "linux":
-            set_envvar_linux(env_name, value)
+            for env_name, value in env_vars:
+                set_envvar_linux(env_name, value)
         else:
             print(f"Unsupported platform: {sys.platform}", file=sys.stderr)
             sys.exit(1)
     except Exception as e:
-        print(f"Error setting variable {env_name}: {e}", file=sys.stderr)
+        print(f"Error setting variables: {e}", file=sys.stderr)
         sys.exit(1)
 
 
@@ -208,14 +285,19 @@ def restore(env_file: Path, overwrite: bool) -> None:
     count_restored = 0
     count_overwritten = 0
 
+    to_restore: list[tuple[str, Any]] = []
+    skipped: list[str] = []
     for key, value in loaded_vars.items():
         if not overwrite and key in os.environ:
-            print(f"Skipping existing variable: {key} with value {value}")
+            skipped.append(f"Skipping existing variable: {key} with value {value}\n")
             continue
         count_restored += 1
         if overwrite and key in os.environ:
             count_overwritten += 1
-        set_environment_variable(key, value)
+        to_restore.append((key, value))
+
+    sys.stdout.write("".join(skipped))
+    set_environment_variables(to_restore)
 
     print("Zusammenfassung der Wiederherstellung:")
     print(f"Restored {count_restored} environment variables.")
@@ -2,16 +2,25 @@
 # requires-python = ">=3.12"
 # dependencies = [
 #     "click",
+#     "numpy",
 #     "openpyxl",
 #     "pandas",
+#     "pyahocorasick",
+#     "python-calamine",
 #     "rich",
+#     "xlsxwriter",
 # ]
 # ///
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import click
+import numpy as np
 import pandas as pd
+import xlsxwriter
 from rich.console import Console
 from rich.progress import (
     Progress,
@@ -23,6 +32,56 @@ from rich.progress import (
 from rich.panel import Panel
 from rich.table import Table
 
+try:  # Aho-Corasick scans a filename once for all patterns at once
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Below this many patterns the plain tuple loop is at least as fast
+_AC_MIN_PATTERNS = 4
+
+
+def _build_automaton(patterns: tuple[str, ...]):
+    """Build an Aho-Corasick automaton, or None when not worthwhile."""
+    if ahocorasick is None or len(patterns) < _AC_MIN_PATTERNS:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+try:  # calamine parses XLSX in Rust, an order of magnitude faster than openpyxl
+    import python_calamine  # noqa: F401
+
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
+# Read-only mode streams the sheet XML instead of building the full
+# openpyxl workbook model (styles, formulas, external links)
+_OPENPYXL_KWARGS = {"read_only": True, "data_only": True, "keep_links": False}
+
+
+def _engine_args() -> tuple[str, dict]:
+    """Return the fastest available pandas Excel engine and its kwargs."""
+    if _HAS_CALAMINE:
+        return "calamine", {}
+    return "openpyxl", _OPENPYXL_KWARGS
+
+
+def _read_sheets(file_path: Path) -> dict[str, pd.DataFrame]:
+    """Read all sheets of a workbook with the fastest available engine.
+
+    The ExcelFile context manager parses the zip container once for all
+    sheets and guarantees the file handle is closed even when a sheet
+    fails to parse.
+    """
+    engine, engine_kwargs = _engine_args()
+    with pd.ExcelFile(file_path, engine=engine, engine_kwargs=engine_kwargs) as excel_file:
+        return {name: excel_file.parse(sheet_name=name) for name in excel_file.sheet_names}
+
 
 @dataclass
 class Options:
@@ -39,9 +98,15 @@ class Options:
     extensions: list[str] = field(default_factory=list)
 
     def __post_init__(self):
-        """Initialize default extensions if none provided."""
+        """Initialize default extensions and precompute filter lookups."""
         if len(self.extensions) == 0:
             self.extensions = [".xls", ".xlsx"]
+        # One hashed membership test per file instead of a linear scan
+        self._ext_set = frozenset(ext.lower() for ext in self.extensions)
+        self._has_include = bool(self.include)
+        self._has_exclude = bool(self.exclude)
+        self._inc_ac = _build_automaton(self.include)
+        self._exc_ac = _build_automaton(self.exclude)
 
     def is_allowed(self, path: Path) -> bool:
         """Check if a file path meets all filtering criteria.
@@ -56,12 +121,19 @@ class Options:
         """
         if not self.is_extension(path):
             return False
-        if len(self.include) > 0 and not any(incl in path.name for incl in self.include):
+        if self._has_include and not self._matches_any(self._inc_ac, self.include, path.name):
             return False
-        if len(self.exclude) > 0 and any(excl in path.name for excl in self.exclude):
+        if self._has_exclude and self._matches_any(self._exc_ac, self.exclude, path.name):
             return False
         return True
 
+    @staticmethod
+    def _matches_any(automaton, patterns: tuple[str, ...], name: str) -> bool:
+        """Check whether any pattern occurs in name, in one scan if possible."""
+        if automaton is not None:
+            return next(automaton.iter(name), None) is not None
+        return any(pattern in name for pattern in patterns)
+
     def is_extension(self, path: Path) -> bool:
         """Check if a file has one of the allowed extensions.
 
@@ -73,10 +145,10 @@ class Options:
         -------
             True if extension matches allowed list, False otherwise
         """
-        return any(path.suffix.lower() == ext for ext in self.extensions)
+        return path.suffix.lower() in self._ext_set
 
 
-def find_excel_files(directory: Path, options: Options) -> list[Path]:
+def find_excel_files(directory: Path, options: Options) -> list[tuple[Path, int]]:
     """Recursively find all Excel files in a directory matching filter options.
 
     Parameters
@@ -84,15 +156,53 @@ def find_excel_files(directory: Path, options: Options) -> list[Path]:
         directory: Base directory to search in
         options: Filter options to apply
 
+    The walk uses os.scandir instead of Path.rglob: DirEntry answers
+    is_dir/is_file from the directory listing without an extra stat call,
+    and a Path object is only built for entries that match the filters.
+
     Returns
     -------
-        List of Path objects to Excel files that match criteria
+        List of (path, size in bytes) tuples for matching Excel files
     """
+    allowed_exts = options._ext_set
+    include = options.include
+    exclude = options.exclude
+    inc_ac = options._inc_ac
+    exc_ac = options._exc_ac
+    matches_any = options._matches_any
+
     result = []
-    for path in directory.rglob("*"):
-        if not path.is_file() or not options.is_allowed(path):
+    stack = [str(directory)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
             continue
-        result.append(path)
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                name = entry.name
+                dot = name.rfind(".")
+                if dot <= 0 or name[dot:].lower() not in allowed_exts:
+                    continue
+                if include and not matches_any(inc_ac, include, name):
+                    continue
+                if exclude and matches_any(exc_ac, exclude, name):
+                    continue
+                try:
+                    # DirEntry.stat is cached, sparing display_file_table
+                    # a second stat() per file later on
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                result.append((Path(entry.path), size))
     return result
 
 
@@ -109,7 +219,7 @@ def read_excel_file(file_path: Path, console: Console) -> dict[str, pd.DataFrame
         DataFrame if file was read successfully, None if there was an error
     """
     try:
-        return pd.read_excel(file_path, engine="openpyxl", sheet_name=None)
+        return _read_sheets(file_path)
     except Exception as e:
         console.print(f"[bold red]Error reading {file_path}: {str(e)}[/]")
         return {}
@@ -132,42 +242,176 @@ def create_progress_bar(console: Console) -> Progress:
         BarColumn(),
         TaskProgressColumn(),
         console=console,
+        # Four repaints per second are enough feedback; re-rendering on
+        # every update dominates wall time with thousands of small files
+        refresh_per_second=4,
     )
 
 
-def read_excel_files(excel_files: list[Path], console: Console) -> list[pd.DataFrame]:
-    """Read multiple Excel files with progress tracking.
+def _read_excel_worker(file_path: Path) -> tuple[Path, dict[str, pd.DataFrame], str]:
+    """Read one Excel file in a worker process.
+
+    Top-level function so ProcessPoolExecutor can pickle it; errors are
+    returned as a message instead of printed, since the Rich console only
+    lives in the main process.
 
     Parameters
     ----------
-        excel_files: List of Excel file paths to read
+        file_path: Path to the Excel file
+
+    Returns
+    -------
+        Tuple of (file path, sheets by name, error message or empty string)
+    """
+    try:
+        return file_path, _read_sheets(file_path), ""
+    except Exception as e:
+        return file_path, {}, str(e)
+
+
+def merge_excel_files(excel_files: list[Path], output_path: Path, console: Console) -> int:
+    """Stream all sheets of the input files into one output workbook.
+
+    The writer runs in constant_memory mode and flushes row by row, so
+    peak memory stays at roughly one input file instead of the whole
+    merged data set. Files are still parsed in worker processes; results
+    are consumed in input order and released after writing.
+
+    Parameters
+    ----------
+        excel_files: List of Excel file paths to merge
+        output_path: Path of the output workbook
         console: Rich console for display
 
     Returns
     -------
-        List of successfully read DataFrames
+        Number of data rows written (without the header row)
+
+    Raises
+    ------
+        click.Abort: If no sheet could be read from any input file
     """
-    dataframes = []
+    workbook = xlsxwriter.Workbook(
+        output_path,
+        {
+            "constant_memory": True,
+            "nan_inf_to_errors": True,
+            # Without a date format, datetime cells come out as raw
+            # Excel serial numbers
+            "default_date_format": "yyyy-mm-dd hh:mm:ss",
+        },
+    )
+    worksheet = workbook.add_worksheet("Merged")
+    row_ix = 0
+    header: list | None = None
 
     with create_progress_bar(console) as progress:
-        task = progress.add_task("[cyan]Reading Excel files...", total=len(excel_files))
+        task = progress.add_task("[cyan]Merging Excel files...", total=len(excel_files))
+
+        if len(excel_files) < 2:
+            results = (_read_excel_worker(excel_file) for excel_file in excel_files)
+            for file_path, sheets, error in results:
+                row_ix, header = _write_file_rows(worksheet, row_ix, header, file_path, sheets, error, console)
+                progress.update(task, advance=1, description=f"[cyan]Merging {file_path.name}...")
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for i, (file_path, sheets, error) in enumerate(executor.map(_read_excel_worker, excel_files)):
+                    row_ix, header = _write_file_rows(worksheet, row_ix, header, file_path, sheets, error, console)
+                    # Refresh the (styled, costly) description only every 16 files
+                    if i & 15 == 0:
+                        progress.update(task, advance=1, description=f"[cyan]Merging {file_path.name}...")
+                    else:
+                        progress.update(task, advance=1)
+
+    workbook.close()
+
+    if header is None:
+        # Not a single sheet could be read; a header-less output file
+        # would only look like a successful merge
+        output_path.unlink(missing_ok=True)
+        console.print("[bold red]No valid Excel files found![/]")
+        raise click.Abort()
+
+    return max(row_ix - 1, 0)
+
+
+def _write_file_rows(
+    worksheet, row_ix: int, header: list | None, file_path: Path, sheets, error: str, console: Console
+) -> tuple[int, list | None]:
+    """Append one file's sheet rows to the worksheet.
+
+    The first sheet defines the merged header; later sheets are aligned
+    to it by column name so differing column order or count never lands
+    values under the wrong header. Returns the next row index and the
+    header columns.
+    """
+    if error:
+        console.print(f"[bold red]Error reading {file_path}: {error}[/]")
+        return row_ix, header
+    for frame in sheets.values():
+        if header is None:
+            header = list(frame.columns)
+            worksheet.write_row(0, 0, [str(col) for col in header])
+            row_ix = 1
+        if list(frame.columns) != header:
+            extra = [str(col) for col in frame.columns if col not in header]
+            if extra:
+                console.print(
+                    f"[yellow]Warning: {file_path.name}: ignoring columns not in the merged header: "
+                    f"{', '.join(extra)}[/]"
+                )
+            # Missing columns become empty cells instead of shifted rows
+            frame = frame.reindex(columns=header)
+        for row in frame.itertuples(index=False, name=None):
+            worksheet.write_row(row_ix, 0, row)
+            row_ix += 1
+    return row_ix, header
+
+
+# Frames buffered per partial merge; bounds peak memory and keeps the
+# merge tree balanced instead of concatenating N tiny frames at once
+_CONCAT_BATCH_SIZE = 64
+
+
+def iter_excel_frames(excel_files: list[Path], console: Console):
+    """Yield each sheet's DataFrame as soon as its file is parsed.
+
+    Worker processes prefetch the next files while the consumer is still
+    working on the current frame, overlapping parse and concat work.
+
+    Parameters
+    ----------
+        excel_files: List of Excel file paths to read
+        console: Rich console for error display
 
+    Yields
+    ------
+        One DataFrame per successfully read sheet, in input order
+    """
+    if len(excel_files) < 2:
         for excel_file in excel_files:
-            progress.update(task, advance=1, description=f"[cyan]Reading {excel_file.name}...")
-            sheets = read_excel_file(excel_file, console)
-            if sheets is None:
+            yield from read_excel_file(excel_file, console).values()
+        return
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for file_path, sheets, error in executor.map(_read_excel_worker, excel_files):
+            if error:
+                console.print(f"[bold red]Error reading {file_path}: {error}[/]")
                 continue
-            dataframes.append(sheets)
+            yield from sheets.values()
 
-    return dataframes
 
+def concat_dataframes(dataframes: Iterable[pd.DataFrame], console: Console) -> pd.DataFrame:
+    """Concatenate DataFrames into one, consuming the input incrementally.
 
-def concat_dataframes(dataframes: list[pd.DataFrame], console: Console) -> pd.DataFrame:
-    """Concatenate multiple DataFrames into one.
+    Frames are merged in batches of _CONCAT_BATCH_SIZE while the producer
+    may still be reading, so at most one batch plus the partial results
+    is alive at a time. Combined with iter_excel_frames this overlaps
+    parsing and concatenation instead of materializing every frame first.
 
     Parameters
     ----------
-        dataframes: List of DataFrames to concatenate
+        dataframes: Iterable of DataFrames to concatenate
         console: Rich console for error display
 
     Returns
@@ -178,19 +422,57 @@ def concat_dataframes(dataframes: list[pd.DataFrame], console: Console) -> pd.Da
     ------
         click.Abort: If no valid DataFrames are available
     """
-    if not dataframes:
+    partials: list[pd.DataFrame] = []
+    batch: list[pd.DataFrame] = []
+    for frame in dataframes:
+        batch.append(frame)
+        if len(batch) >= _CONCAT_BATCH_SIZE:
+            partials.append(_concat_batch(batch))
+            batch = []
+    if batch:
+        partials.append(_concat_batch(batch))
+
+    if not partials:
         console.print("[bold red]No valid Excel files found![/]")
         raise click.Abort()
+    if len(partials) == 1:
+        return partials[0]
+    return _concat_batch(partials)
 
-    return pd.concat(dataframes, ignore_index=True)
 
+def _concat_batch(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate one batch of DataFrames.
 
-def display_file_table(files: list[Path], console: Console) -> None:
+    When all frames share the same columns and dtypes, each output column
+    is built with np.concatenate, which skips pandas' block alignment and
+    consolidation; mismatched schemas fall back to pd.concat.
+    """
+    if len(frames) == 1:
+        return frames[0]
+
+    first = frames[0]
+    columns = list(first.columns)
+    dtypes = list(first.dtypes)
+    homogeneous = all(
+        list(frame.columns) == columns and list(frame.dtypes) == dtypes for frame in frames[1:]
+    )
+    if homogeneous:
+        data = {col: np.concatenate([frame[col].to_numpy(copy=False) for frame in frames]) for col in columns}
+        return pd.DataFrame(data, columns=columns, copy=False)
+
+    combined = pd.concat(frames, ignore_index=True)
+    # Rebuild each column as one contiguous buffer; pd.concat can leave
+    # fragmented blocks that the Excel writer would walk with strides
+    data = {col: np.ascontiguousarray(combined[col].to_numpy()) for col in combined.columns}
+    return pd.DataFrame(data, columns=list(combined.columns), copy=False)
+
+
+def display_file_table(files: list[tuple[Path, int]], console: Console) -> None:
     """Display a formatted table of found Excel files.
 
     Parameters
     ----------
-        files: List of file paths to display
+        files: List of (path, size in bytes) tuples to display
         console: Rich console for display
     """
     table = Table(title="Found Excel Files")
@@ -198,9 +480,8 @@ def display_file_table(files: list[Path], console: Console) -> None:
     table.add_column("Filename", style="green")
     table.add_column("Size", style="magenta", justify="right")
 
-    for i, file in enumerate(files, 1):
-        size_kb = file.stat().st_size / 1024
-        table.add_row(str(i), file.name, f"{size_kb:.1f} KB")
+    for i, (file, size) in enumerate(files, 1):
+        table.add_row(str(i), file.name, f"{size / 1024:.1f} KB")
 
     console.print(table)
 
@@ -216,7 +497,8 @@ def save_dataframe(df: pd.DataFrame, output_path: Path, console: Console) -> Non
     """
     with create_progress_bar(console) as progress:
         task = progress.add_task("[cyan]Saving output file...", total=1)
-        df.to_excel(output_path, index=False)
+        # xlsxwriter writes noticeably faster than the openpyxl default
+        df.to_excel(output_path, index=False, engine="xlsxwriter")
         progress.update(task, advance=1, completed=True)
 
 
@@ -230,17 +512,17 @@ def print_header(console: Console) -> None:
     console.print(Panel.fit("[bold cyan]Excel Files Merger[/]", border_style="cyan"))
 
 
-def print_result_summary(df: pd.DataFrame, output_path: Path, console: Console) -> None:
+def print_result_summary(row_count: int, output_path: Path, console: Console) -> None:
     """Display a summary of the operation results.
 
     Parameters
     ----------
-        df: The concatenated DataFrame
+        row_count: Number of merged data rows
         output_path: Path where the file was saved
         console: Rich console for display
     """
     console.print(f"[bold green]✓ Done! [/]Merged data has been saved to: {output_path}")
-    console.print(f"[dim]Number of rows: {len(df)}[/]")
+    console.print(f"[dim]Number of rows: {row_count}[/]")
 
 
 @click.command()
@@ -270,7 +552,14 @@ def print_result_summary(df: pd.DataFrame, output_path: Path, console: Console)
     multiple=True,
     help="Exclude files containing this string (can be used multiple times)",
 )
-def main(dir: Path, output: Path, include: tuple, exclude: tuple):
+@click.option(
+    "--in-memory",
+    "-m",
+    is_flag=True,
+    default=False,
+    help="Concatenate all sheets in memory before saving instead of streaming row by row",
+)
+def main(dir: Path, output: Path, include: tuple, exclude: tuple, in_memory: bool):
     """Tool for merging multiple Excel files into a single file.
 
     This utility recursively searches through directories to find Excel files,
@@ -305,14 +594,18 @@ def main(dir: Path, output: Path, include: tuple, exclude: tuple):
     console.print(f"[green]{len(excel_files)} Excel files found.[/]")
     display_file_table(excel_files, console)
 
-    console.print("\n[yellow]Beginning to merge files...[/]")
-    dataframes = read_excel_files(excel_files, console)
-    combined_df = concat_dataframes(dataframes, console)
-
-    console.print(f"\n[yellow]Saving merged data to:[/] {output}")
-    save_dataframe(combined_df, output, console)
-
-    print_result_summary(combined_df, output, console)
+    console.print(f"\n[yellow]Beginning to merge files into:[/] {output}")
+    paths = [path for path, _ in excel_files]
+    if in_memory:
+        # Builds one DataFrame via pandas; needs memory for the whole
+        # result but aligns mixed schemas exactly like pd.concat
+        merged = concat_dataframes(iter_excel_frames(paths, console), console)
+        save_dataframe(merged, output, console)
+        row_count = len(merged)
+    else:
+        row_count = merge_excel_files(paths, output, console)
+
+    print_result_summary(row_count, output, console)
 
 
 if __name__ == "__main__":
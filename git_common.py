@@ -5,9 +5,11 @@ This module contains common classes and functions that can be used by various
 Git-related scripts in the python-utility project.
 """
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from rich.console import Console
 
@@ -20,28 +22,43 @@ class GitOptions:
     verbose: bool = False  # Show verbose output
     recursive: bool = False  # Search recursively in subdirectories
 
-    # List of field names to ignore during comparison
+    # Attributes compared in __eq__/__hash__, fixed at class definition
+    # instead of intersecting __annotations__ on every comparison
+    _COMPARE_ATTRS: ClassVar[tuple[str, ...]] = ("verbose", "recursive")
+
     def __eq__(self, other):
         if not isinstance(other, GitOptions):
             return False
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self._COMPARE_ATTRS)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, attr) for attr in self._COMPARE_ATTRS))
 
-        # Compare only attributes defined in both classes
-        attrs = set(self.__annotations__).intersection(set(other.__annotations__))
-        return all(getattr(self, attr) == getattr(other, attr) for attr in attrs)
+
+@lru_cache(maxsize=4096)
+def _is_git_repository_cached(path_str: str) -> bool:
+    """Checks for a .git directory entry with a single scandir pass."""
+    try:
+        with os.scandir(path_str) as entries:
+            return any(entry.name == ".git" and entry.is_dir(follow_symlinks=False) for entry in entries)
+    except OSError:
+        return False
 
 
 def is_git_repository(path: Path) -> bool:
     """
     Checks if a directory is a Git repository.
 
+    The answer is cached because recursive walkers revisit the same
+    parent directories during descent.
+
     Args:
         path: Path to the directory to check
 
     Returns:
         True if the directory is a Git repository, otherwise False
     """
-    git_dir = path / ".git"
-    return git_dir.exists() and git_dir.is_dir()
+    return _is_git_repository_cached(os.fspath(path))
 
 
 def get_subdirectories(path: Path) -> List[Path]:
@@ -2,14 +2,20 @@
 # requires-python = ">=3.13"
 # dependencies = [
 #     "click",
+#     "pygit2",
 #     "rich",
 # ]
 # ///
 import os
 import platform
+import shlex
 import shutil
+import stat
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 
 import click
@@ -17,6 +23,36 @@ from rich.console import Console
 
 from git_common import GitOptions as BaseGitOptions
 
+try:  # libgit2 runs the git pipeline in-process without spawning git
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# Queried once; platform.system() walks uname on every call
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_MAC = _SYSTEM == "Darwin"
+
+# Constructing a Console probes the terminal (isatty, width, env vars);
+# one shared instance is enough for the whole script
+_CONSOLE = Console()
+
+# Environment for every git spawn: skips work irrelevant to eol
+# normalization (LFS smudging, hooks, fsmonitor, auto-gc mid-pipeline).
+# GIT_CONFIG_COUNT injects the -c overrides without touching argv.
+_GIT_ENV = {
+    **os.environ,
+    "GIT_LFS_SKIP_SMUDGE": "1",
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_CONFIG_COUNT": "3",
+    "GIT_CONFIG_KEY_0": "core.hooksPath",
+    "GIT_CONFIG_VALUE_0": os.devnull,
+    "GIT_CONFIG_KEY_1": "core.fsmonitor",
+    "GIT_CONFIG_VALUE_1": "false",
+    "GIT_CONFIG_KEY_2": "gc.auto",
+    "GIT_CONFIG_VALUE_2": "0",
+}
+
 
 @dataclass
 class GitOptions(BaseGitOptions):
@@ -28,6 +64,9 @@ class GitOptions(BaseGitOptions):
     force: bool = False
     continue_process: bool = True
     should_overwrite: bool = True
+    # Result of the .git probe in overwrite_existing_repo; lets
+    # overwrite_repository skip its own stat calls
+    _git_dir_existed: bool | None = None
 
     def __post_init__(self):
         if self.extensions is None:
@@ -35,7 +74,12 @@ class GitOptions(BaseGitOptions):
 
 
 def run_git_command(
-    console: Console, command: list[str], options: GitOptions, error_message: str
+    console: Console,
+    command: list[str],
+    options: GitOptions,
+    error_message: str,
+    capture_output: bool = False,
+    cwd: Path | None = None,
 ) -> tuple[bool, subprocess.CompletedProcess[bytes] | None]:
     """
     Executes a Git command and returns the result.
@@ -45,32 +89,49 @@ def run_git_command(
         command: List with the command to execute and its arguments
         options: GitOptions with configuration options
         error_message: Error message to display on error
+        capture_output: If True, stdout is captured even without verbose
+        cwd: Directory the command runs in (default: current directory)
 
     Returns:
         Tuple with a Boolean (True on success, False on error) and the CompletedProcess object (or None on error)
     """
     try:
-        result = subprocess.run(command, check=True, capture_output=True)
-
-        if options.verbose:
-            console.print(f"[dim]Command: {' '.join(command)}[/]")
-            console.print(f"[dim]Output: {result.stdout.decode() if result.stdout else 'No output'}[/]")
+        if options.verbose or capture_output:
+            result = subprocess.run(command, check=True, capture_output=True, cwd=cwd, close_fds=False, env=_GIT_ENV)
+            if options.verbose:
+                console.print(f"[dim]Command: {shlex.join(command)}[/]")
+                console.print(f"[dim]Output: {result.stdout.decode() if result.stdout else 'No output'}[/]")
+        else:
+            # Nobody reads stdout on success; only keep stderr for the
+            # error branch instead of buffering and decoding everything
+            result = subprocess.run(
+                command,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=cwd,
+                close_fds=False,
+                env=_GIT_ENV,
+            )
 
         return True, result
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]{error_message}[/] {e}")
-        console.print(f"Output: {e.stdout.decode() if e.stdout else ''}")
-        console.print(f"Error: {e.stderr.decode() if e.stderr else ''}")
+        if e.stdout:
+            console.print(f"Output: {e.stdout.decode(errors='replace')}")
+        if e.stderr:
+            console.print(f"Error: {e.stderr.decode(errors='replace')}")
         return False, None
 
 
-def init_git_repo(console: Console, options: GitOptions) -> bool:
+def init_git_repo(console: Console, options: GitOptions, cwd: Path | None = None) -> bool:
     """
     Initialize Git repository.
 
     Args:
         console: Console object for output
         options: GitOptions with configuration options
+        cwd: Directory of the repository (default: current directory)
 
     Returns:
         True on success, False on error
@@ -81,17 +142,19 @@ def init_git_repo(console: Console, options: GitOptions) -> bool:
         ["git", "init", "."],
         options,
         "Error initializing Git repository:",
+        cwd=cwd,
     )
     return success
 
 
-def add_files_to_git(console: Console, options: GitOptions) -> bool:
+def add_files_to_git(console: Console, options: GitOptions, cwd: Path | None = None) -> bool:
     """
     Add all files to the repository.
 
     Args:
         console: Console object for output
         options: GitOptions with configuration options
+        cwd: Directory of the repository (default: current directory)
 
     Returns:
         True on success, False on error
@@ -102,58 +165,154 @@ def add_files_to_git(console: Console, options: GitOptions) -> bool:
         ["git", "add", "."],
         options,
         "Error adding files:",
+        cwd=cwd,
     )
     return success
 
 
-def create_initial_commit(console: Console, options: GitOptions) -> bool:
+def create_initial_commit(console: Console, options: GitOptions, cwd: Path | None = None) -> bool:
     """
-    Create initial commit, but only if there are changes.
+    Create initial commit.
 
     Args:
         console: Console object for output
         options: GitOptions with configuration options
+        cwd: Directory of the repository (default: current directory)
 
     Returns:
         True on success, False on error
     """
-    # Check if there are changes that can be committed
-    success, result = run_git_command(
+    console.print("[bold blue]Creating initial commit...[/]")
+    # --allow-empty makes the "nothing to commit" precheck via
+    # git status unnecessary, saving a whole subprocess spawn
+    success, _ = run_git_command(
         console,
-        ["git", "status", "--porcelain"],
+        ["git", "commit", "-m", "initial commit", "--allow-empty"],
         options,
-        "Error checking Git status:",
+        "Error creating initial commit:",
+        cwd=cwd,
     )
+    return success
 
-    if not success:
-        return False
 
-    if result is None:
-        console.print("[bold red]Error checking Git status (Result is NONE).[/]")
-        return False
+def run_git_pipeline(console: Console, options: GitOptions, directory: Path | None = None) -> bool:
+    """
+    Runs the whole init/add/commit/normalize sequence as one subprocess.
+
+    Each separate git invocation pays fork+exec plus git startup cost;
+    chaining the commands with && in a single shell call spawns one
+    process instead of five.
+
+    Args:
+        console: Console object for output
+        options: GitOptions with configuration options
+        directory: Directory of the repository (default: current directory)
+
+    Returns:
+        True on success, False on error
+    """
+    # git add --renormalize would be the lighter idiom, but it only fixes
+    # the index: stat-clean working files are never re-smudged, so the
+    # eol conversion would not reach the files themselves. Dropping the
+    # index entries and hard-resetting is the sequence that forces git to
+    # rewrite every tracked file through the eol filter.
+    commands = [
+        "git init .",
+        "git add .",
+        'git commit -m "initial commit" --allow-empty',
+        "git rm --cached -r .",
+        "git reset --hard",
+    ]
+    script = " && ".join(commands)
+
+    console.print("[bold blue]Initializing repository and adjusting line endings...[/]")
+    try:
+        if options.verbose:
+            result = subprocess.run(
+                script, shell=True, check=True, capture_output=True, cwd=directory, close_fds=False, env=_GIT_ENV
+            )
+            console.print(f"[dim]Command: {script}[/]")
+            console.print(f"[dim]Output: {result.stdout.decode() if result.stdout else 'No output'}[/]")
+        else:
+            # Nobody reads stdout on success; only keep stderr for the
+            # error branch instead of buffering and decoding everything
+            subprocess.run(
+                script,
+                shell=True,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=directory,
+                close_fds=False,
+                env=_GIT_ENV,
+            )
 
-    # If no changes exist, there's nothing to commit
-    if not result.stdout.strip():
-        console.print("[yellow]No changes to commit.[/]")
         return True
+    except subprocess.CalledProcessError as e:
+        console.print(f"[bold red]Error running Git pipeline:[/] {e}")
+        if e.stdout:
+            console.print(f"Output: {e.stdout.decode(errors='replace')}")
+        if e.stderr:
+            console.print(f"Error: {e.stderr.decode(errors='replace')}")
+        return False
 
-    console.print("[bold blue]Creating initial commit...[/]")
-    success, _ = run_git_command(
-        console,
-        ["git", "commit", "-m", "initial commit"],
-        options,
-        "Error creating initial commit:",
-    )
-    return success
+
+def run_pygit2_pipeline(console: Console, options: GitOptions, directory: Path | None = None) -> bool:
+    """
+    Runs the init/add/commit/normalize sequence in-process via pygit2.
+
+    Skips the git process startup cost entirely: libgit2 keeps the
+    object database open and applies the same eol filters on checkout.
+
+    Args:
+        console: Console object for output
+        options: GitOptions with configuration options
+        directory: Directory of the repository (default: current directory)
+
+    Returns:
+        True on success, False on error
+    """
+    root = directory if directory is not None else Path(".")
+    console.print("[bold blue]Initializing repository and adjusting line endings...[/]")
+    try:
+        repo = pygit2.init_repository(str(root))
+        repo.index.add_all()
+        repo.index.write()
+        tree_id = repo.index.write_tree()
+        signature = pygit2.Signature("git-lineendings", "git-lineendings@localhost")
+        # An adjusted existing repository already has commits; HEAD must
+        # then be the first parent or libgit2 refuses the commit
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+        repo.create_commit("HEAD", signature, signature, "initial commit", tree_id, parents)
+
+        # As with the subprocess pipeline, stat-clean working files are
+        # never re-smudged; deleting them first forces the checkout to
+        # recreate every tracked file through the eol filter
+        for entry in repo.index:
+            file_path = root / entry.path
+            if file_path.is_file():
+                file_path.unlink()
+        repo.checkout_tree(
+            repo.get(tree_id),
+            strategy=pygit2.GIT_CHECKOUT_FORCE | pygit2.GIT_CHECKOUT_RECREATE_MISSING,
+        )
+
+        if options.verbose:
+            console.print(f"[dim]Committed and re-checked out {len(repo.index)} files via pygit2[/]")
+        return True
+    except Exception as e:
+        console.print(f"[bold red]Error running pygit2 pipeline:[/] {e}")
+        return False
 
 
-def create_gitattributes(console: Console, options: GitOptions) -> bool:
+def create_gitattributes(console: Console, options: GitOptions, directory: Path | None = None) -> bool:
     """
     Creates the .gitattributes file with the desired line endings.
 
     Args:
         console: Console object for output
         options: GitOptions with configuration options
+        directory: Directory for the file (default: current directory)
 
     Returns:
         True on success, False on error
@@ -161,21 +320,19 @@ def create_gitattributes(console: Console, options: GitOptions) -> bool:
     try:
         console.print(f"[bold blue]Creating .gitattributes for {options.line_ending} line endings...[/]")
 
-        with open(".gitattributes", "w", encoding="utf-8") as f:
-            # Add a rule for each specified file extension
-            if options.extensions:
-                for ext in options.extensions:
-                    ext_pattern = f"*.{ext}" if not ext.startswith("*.") else ext
-                    f.write(f"{ext_pattern} text eol={options.line_ending}\n")
-
-                    if options.verbose:
-                        console.print(f"[dim]Rule added: {ext_pattern} text eol={options.line_ending}[/]")
-            else:
-                # Default rule for all text files
-                f.write(f"* text eol={options.line_ending}\n")
+        # "*" stands in as the default rule for all text files, so the
+        # extension and default branches share one code path
+        lines = [
+            f"{ext if ext.startswith('*') else f'*.{ext}'} text eol={options.line_ending}"
+            for ext in (options.extensions or ["*"])
+        ]
+        # Encode once and write the bytes directly: one syscall, no
+        # incremental encoder state from the text IO layer
+        target = (directory if directory is not None else Path(".")) / ".gitattributes"
+        target.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
 
-                if options.verbose:
-                    console.print(f"[dim]Default rule added: * text eol={options.line_ending}[/]")
+        if options.verbose:
+            console.print("[dim]Rules added:\n" + "\n".join(lines) + "[/]")
 
         return True
     except Exception as e:
@@ -183,13 +340,14 @@ def create_gitattributes(console: Console, options: GitOptions) -> bool:
         return False
 
 
-def clear_git_cache(console: Console, options: GitOptions) -> bool:
+def clear_git_cache(console: Console, options: GitOptions, cwd: Path | None = None) -> bool:
     """
     Clear Git cache.
 
     Args:
         console: Console object for output
         options: GitOptions with configuration options
+        cwd: Directory of the repository (default: current directory)
 
     Returns:
         True on success, False on error
@@ -200,17 +358,19 @@ def clear_git_cache(console: Console, options: GitOptions) -> bool:
         ["git", "rm", "--cached", "-r", "."],
         options,
         "Error clearing Git cache:",
+        cwd=cwd,
     )
     return success
 
 
-def reset_changes(console: Console, options: GitOptions) -> bool:
+def reset_changes(console: Console, options: GitOptions, cwd: Path | None = None) -> bool:
     """
     Reset changes and adjust line endings.
 
     Args:
         console: Console object for output
         options: GitOptions with configuration options
+        cwd: Directory of the repository (default: current directory)
 
     Returns:
         True on success, False on error
@@ -221,6 +381,7 @@ def reset_changes(console: Console, options: GitOptions) -> bool:
         ["git", "reset", "--hard"],
         options,
         "Error resetting changes:",
+        cwd=cwd,
     )
     return success
 
@@ -237,24 +398,24 @@ def cleanup_git_files(console: Console, directory: Path, options: GitOptions) ->
     Returns:
         True on success, False on error
     """
-    # Delete .gitattributes file (created by create_gitattributes)
-    # Additional files that could be created by Git operations in create_temp_git_repo
-    git_files = [
-        ".gitattributes",
-        ".gitignore",  # Could be created by Git operations
-        ".gitmodules",  # Could be created for submodules
-        ".gitconfig",  # Could be created by Git configuration
-    ]
+    # Only .gitattributes is ever created by this tool; .gitignore and
+    # friends may be user-authored and must not be touched
+    git_files = frozenset({".gitattributes"})
 
     try:
-        for git_file in git_files:
-            file_path = directory / git_file
-            if not file_path.exists():
-                continue
-            if options.verbose:
-                console.print(f"[dim]Deleting file: {file_path}[/]")
-            file_path.unlink()
-            console.print(f"[bold green]{git_file} has been deleted.[/]")
+        # One scandir pass instead of an exists() stat per candidate; the
+        # unlink itself is the existence check
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name not in git_files or not entry.is_file(follow_symlinks=False):
+                    continue
+                if options.verbose:
+                    console.print(f"[dim]Deleting file: {entry.path}[/]")
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue
+                console.print(f"[bold green]{entry.name} has been deleted.[/]")
         return True
     except Exception as e:
         console.print(f"[bold red]Error deleting Git files:[/] {e}")
@@ -273,8 +434,14 @@ def overwrite_repository(console: Console, directory: Path, options: GitOptions)
     Returns:
         True on success, False on error
     """
+    # Reuse the probe from overwrite_existing_repo when available;
+    # otherwise fall back to checking the path here
     git_dir = directory / ".git"
-    if not git_dir.exists() or not git_dir.is_dir():
+    exists = options._git_dir_existed
+    if exists is None:
+        exists = git_dir.exists() and git_dir.is_dir()
+
+    if not exists:
         # No repository present, nothing to do
         if options.verbose:
             console.print("[dim]No existing Git repository found to overwrite.[/]")
@@ -304,44 +471,28 @@ def cleanup_git_dir(console: Console, directory: Path, options: GitOptions) -> b
         if options.verbose:
             console.print(f"[dim]Deleting directory: {git_dir}[/]")
 
-        # Wait briefly so all files can be closed
-        import time
+        # Read-only object files are the usual reason rmtree fails on
+        # Windows; clearing the flag and retrying beats shelling out
+        _try_rmtree(git_dir)
 
-        time.sleep(1)  # Wait 1 second
+        # A handle may not be closed yet; back off briefly and retry a
+        # few times instead of sleeping up front on every run (worst
+        # case ~0.6s total, typical case zero)
+        for attempt in range(5):
+            if not git_dir.exists():
+                break
+            time.sleep(0.02 * 2**attempt)
+            _try_rmtree(git_dir)
 
-        # Try with shutil.rmtree
-        shutil.rmtree(git_dir, ignore_errors=True)
+        if git_dir.exists() and _IS_WINDOWS:
+            # Antivirus scanners can hold pack/idx files open longer than
+            # the retries; rd deals with that better than rmtree
+            subprocess.run(["cmd", "/c", "rd", "/s", "/q", str(git_dir)], check=False)
 
-        # Check if the directory still exists
         if not git_dir.exists():
             console.print("[bold green].git directory has been deleted.[/]")
             return True
 
-        # If the directory still exists, try with an external command
-        console.print("[yellow]Could not delete .git directory with Python, trying external command...[/]")
-
-        if platform.system() == "Windows":
-            # On Windows with rd /s /q
-            success, _ = run_git_command(
-                console,
-                ["cmd", "/c", "rd", "/s", "/q", str(git_dir)],
-                options,
-                "Error deleting .git directory:",
-            )
-        else:
-            # On Unix with rm -rf
-            success, _ = run_git_command(
-                console,
-                ["rm", "-rf", str(git_dir)],
-                options,
-                "Error deleting .git directory:",
-            )
-
-        if success:
-            console.print("[bold green].git directory has been deleted.[/]")
-            return True
-
-        # If that doesn't work either, give instructions for manual deletion
         console.print("[bold yellow]The .git directory could not be deleted automatically.[/]")
         console.print(f"Please delete the directory manually: {git_dir}")
         return False
@@ -352,6 +503,27 @@ def cleanup_git_dir(console: Console, directory: Path, options: GitOptions) -> b
         return False
 
 
+def _try_rmtree(path: Path) -> None:
+    """One rmtree attempt; a persisting PermissionError is swallowed.
+
+    The chmod handler covers read-only files, but an open handle (e.g.
+    antivirus) still raises PermissionError on the retry. Swallowing it
+    here keeps the backoff loop and the rd fallback reachable.
+    """
+    try:
+        shutil.rmtree(path, onexc=_force_remove_readonly)
+    except PermissionError:
+        pass
+
+
+def _force_remove_readonly(func, path, exc: BaseException) -> None:
+    """Clears the read-only flag and retries the failed delete call."""
+    if not isinstance(exc, PermissionError):
+        raise exc
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
 def cleanup_git_repo(
     console: Console,
     directory: Path,
@@ -397,7 +569,13 @@ def overwrite_existing_repo(console: Console, directory: Path, options: GitOptio
     - options.should_overwrite: True if the repository should be overwritten, False if only adjusted
     """
     git_dir = directory / ".git"
-    if not git_dir.exists() or not git_dir.is_dir():
+    # One stat answers both the exists and the is-dir question
+    try:
+        options._git_dir_existed = stat.S_ISDIR(os.stat(git_dir).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        options._git_dir_existed = False
+
+    if not options._git_dir_existed:
         # No repository present, nothing to do
         if options.verbose:
             console.print("[dim]No existing Git repository found.[/]")
@@ -449,65 +627,69 @@ def open_file_explorer(directory: Path, console: Console, verbose: bool) -> None
         console: Console object for output
         verbose: If True, detailed information will be displayed
     """
+    # Convert once; the batch mode calls this per directory and both
+    # startfile and Popen otherwise re-run the __fspath__ protocol
+    path_str = os.fspath(directory)
     try:
         if verbose:
-            console.print(f"[dim]Opening file explorer for: {directory}[/]")
+            console.print(f"[dim]Opening file explorer for: {path_str}[/]")
 
-        system = platform.system()
-        if system == "Windows":
-            os.startfile(directory)
-        elif system == "Darwin":  
-            subprocess.run(["open", directory], check=True)
-        else:  # Linux und andere
-            subprocess.run(["xdg-open", directory], check=True)
+        if _IS_WINDOWS:
+            os.startfile(path_str)
+        else:
+            # open/xdg-open may block until a desktop handler exits;
+            # detach the child so the script returns immediately
+            opener = "open" if _IS_MAC else "xdg-open"
+            subprocess.Popen(
+                [opener, path_str],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
 
         console.print(f"[bold green]File explorer for {directory} has been opened.[/]")
     except Exception as e:
         console.print(f"[bold red]Error opening file explorer:[/] {e}")
 
 
-def create_git_repo(directory: Path, options: GitOptions) -> None:
+def create_git_repo(directory: Path, options: GitOptions, console: Console | None = None) -> None:
     """
     Creates a Git repository and adjusts line endings.
 
     Args:
         directory: The directory where line endings should be adjusted
         options: GitOptions with configuration options
-        open_explorer: If True, the file explorer will be opened after completion
+        console: Console object for output (default: shared module console)
     """
-    console = Console()
+    if console is None:
+        console = _CONSOLE
 
     # Ensure the directory exists
     if not directory.exists() or not directory.is_dir():
         console.print(f"[bold red]Error:[/] The directory {directory} does not exist.")
         return
 
-    # Change to the directory
-    original_dir = os.getcwd()
-    os.chdir(directory)
-
     # If the repository should be overwritten, delete the existing .git directory
     if options.should_overwrite:
         if not overwrite_repository(console, directory, options):
             console.print("[bold red]Error overwriting existing repository.[/]")
-            os.chdir(original_dir)
             return
 
-    # List of functions to execute
+    # List of functions to execute; with pygit2 available the git part
+    # runs in-process, otherwise as one batched subprocess. The target
+    # directory is passed explicitly instead of mutating the process
+    # working directory via os.chdir
     steps = [
-        init_git_repo,
         create_gitattributes,
-        add_files_to_git,
-        create_initial_commit,
-        clear_git_cache,
-        reset_changes,
+        run_pygit2_pipeline if pygit2 is not None else run_git_pipeline,
     ]
 
     success = True
     try:
         # Execute each step and check for success
         for step in steps:
-            if step(console, options):
+            if step(console, options, directory):
                 continue
             success = False
             break
@@ -522,9 +704,6 @@ def create_git_repo(directory: Path, options: GitOptions) -> None:
             should_delete_git_dir = options.should_overwrite
             cleanup_git_repo(console, directory, options, should_delete_git_dir)
 
-        # Change back to the original directory
-        os.chdir(original_dir)
-
 
 @click.command()
 @click.argument(
@@ -567,6 +746,20 @@ def create_git_repo(directory: Path, options: GitOptions) -> None:
     default=False,
     help="Open file explorer after completion",
 )
+@click.option(
+    "--directories-file",
+    "-d",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="File with one directory per line to convert instead of DIRECTORY",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    help="Number of directories to convert in parallel (default: 1)",
+)
 def main(
     directory: Path,
     extensions: tuple[str, ...],
@@ -575,6 +768,8 @@ def main(
     keep_git: bool,
     force: bool,
     open_explorer: bool,
+    directories_file: Path | None,
+    jobs: int,
 ):
     """
     Adjusts line endings of files in a directory using Git.
@@ -595,8 +790,12 @@ def main(
         If set, an existing Git repository will be overwritten without confirmation.
     open_explorer : bool
         If set, the file explorer will be opened after completion.
+    directories_file : Path | None
+        File with one directory per line to convert instead of DIRECTORY.
+    jobs : int
+        Number of directories to convert in parallel.
     """
-    console = Console()
+    console = _CONSOLE
 
     if verbose:
         console.print(f"[bold]Directory:[/] {directory}")
@@ -609,30 +808,41 @@ def main(
         console.print(f"[bold]Force mode:[/] {'Yes' if force else 'No'}")
         console.print(f"[bold]Open file explorer:[/] {'Yes' if open_explorer else 'No'}")
 
-    # Create list of file extensions
-    ext_list = []
-    for ext_group in extensions:
-        ext_list.extend([e.strip() for e in ext_group.split(",") if e.strip()])
-
-    # Create GitOptions
-    options = GitOptions(
-        extensions=ext_list,
-        line_ending=line_ending,
-        cleanup=not keep_git,
-        verbose=verbose,
-        force=force,
-    )
-
-    # Check and optionally overwrite an existing repository
-    overwrite_existing_repo(console, directory, options)
-    if not options.continue_process:
-        return
-
-    create_git_repo(directory, options)
-
-    # Open file explorer if desired
-    if open_explorer:
-        open_file_explorer(directory, console, options.verbose)
+    # Create list of file extensions; each -e value may hold a comma list
+    ext_list = [ext.strip() for ext in chain.from_iterable(group.split(",") for group in extensions) if ext.strip()]
+
+    directories = [directory]
+    if directories_file is not None:
+        content = directories_file.read_text(encoding="utf-8")
+        directories = [Path(line.strip()) for line in content.splitlines() if line.strip()]
+
+    # Check and optionally overwrite existing repositories; prompting
+    # stays in the main thread so parallel workers never ask questions
+    tasks: list[tuple[Path, GitOptions]] = []
+    for current in directories:
+        options = GitOptions(
+            extensions=ext_list,
+            line_ending=line_ending,
+            cleanup=not keep_git,
+            verbose=verbose,
+            force=force,
+        )
+        overwrite_existing_repo(console, current, options)
+        if options.continue_process:
+            tasks.append((current, options))
+
+    if jobs > 1 and len(tasks) > 1:
+        # Workers spend nearly all their time in git subprocesses or
+        # libgit2 with the GIL released, so threads scale fine here
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            list(executor.map(lambda task: create_git_repo(task[0], task[1], console), tasks))
+    else:
+        for current, options in tasks:
+            create_git_repo(current, options, console)
+
+    # Open file explorer if desired (only sensible for a single directory)
+    if open_explorer and len(directories) == 1:
+        open_file_explorer(directory, console, verbose)
 
 
 if __name__ == "__main__":
@@ -2,97 +2,89 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "click",
-#     "gitpython",
 #     "rich",
 # ]
 # ///
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
 
 import click
-import git
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from git_common import GitOptions as BaseGitOptions
+from git_common import get_subdirectories, is_git_repository
+
 
 @dataclass
-class GitOptions:
-    """Options for git operations."""
+class GitOptions(BaseGitOptions):
+    """Options for git pull operations."""
 
-    console: Console | None = None  # Console for output
-    verbose: bool = False  # Whether to show verbose output
     stash_message: str | None = None  # Custom message for stash
     recursive: bool = True  # Whether to recursively search subdirectories
 
 
-def get_subdirectories(path: Path) -> Iterable[Path]:
+def run_git(repo_path: Path, *args: str) -> str:
     """
-    Get all subdirectories in the given path.
+    Run a git command in the given repository and return its output.
 
     Parameters
     ----------
-    path : Path
-        The path to search for directories.
+    repo_path : Path
+        The path to the git repository.
+    *args : str
+        The git subcommand and its arguments.
 
     Returns
     -------
-    Iterable[Path]
-        An iterable of Path objects representing the directories found in the path.
-    """
-    for item in path.iterdir():
-        if item.is_file():
-            continue
-        yield item
-
+    str
+        The stdout of the git command.
 
-def is_git_repository(current: Path) -> bool:
+    Raises
+    ------
+    RuntimeError
+        If the git command exits with a non-zero status.
     """
-    Check if the current path is a git repository.
-
-    A path is considered a git repository if it contains a `.git` directory.
-
-    Parameters
-    ----------
-    current : Path
-        The path to check.
-
-    Returns
-    -------
-    bool
-        True if the path is a git repository, False otherwise.
-    """
-    if current.is_file():
-        return False
-    return any(".git" == path.name for path in get_subdirectories(current))
+    result = subprocess.run(
+        ["git", "-C", str(repo_path), *args],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return result.stdout
 
 
-def has_no_changes(repo: git.Git) -> bool:
+def has_no_changes(repo_path: Path) -> bool:
     """
     Check if the repository has no uncommitted changes.
 
     Parameters
     ----------
-    repo : git.Git
-        The repository to check.
+    repo_path : Path
+        The path to the repository to check.
 
     Returns
     -------
     bool
           True if the repository has no changes to commit, False otherwise.
     """
-    return "nothing to commit" in repo.status()
+    # --porcelain prints one line per change and nothing when clean
+    return run_git(repo_path, "status", "--porcelain") == ""
 
 
-def stash_changes(repo: git.Git, options: GitOptions | None = None) -> None:
+def stash_changes(repo_path: Path, options: GitOptions | None = None) -> None:
     """
     Stash changes in the repository.
 
     Parameters
     ----------
-    repo : git.Git
-        The repository to stash changes in.
+    repo_path : Path
+        The path to the repository to stash changes in.
     options : GitOptions, optional
         Options for the git operation, by default None
     """
@@ -103,47 +95,46 @@ def stash_changes(repo: git.Git, options: GitOptions | None = None) -> None:
     stash_message = options.stash_message
     verbose = options.verbose
 
-    if has_no_changes(repo):
+    if has_no_changes(repo_path):
         return
 
-    stash_args = []
+    stash_args = ["stash"]
     if stash_message:
         stash_args.extend(["save", stash_message])
 
-    result = repo.stash(*stash_args)
+    result = run_git(repo_path, *stash_args)
 
     if console and "No local changes to save" not in result:
-        repo_path = Path(repo.rev_parse("--show-toplevel"))
         console.print(f"[yellow]⟳[/yellow] Stashed changes in [bold]{repo_path.name}[/bold]")
         if verbose:
             console.print(f"[blue]ℹ[/blue] Stash result: {result}")
 
 
-def has_stashed_changes(repo: git.Git) -> bool:
+def has_stashed_changes(repo_path: Path) -> bool:
     """
     Check if the repository has any stashed changes.
 
     Parameters
     ----------
-    repo : git.Git
-        The repository to check.
+    repo_path : Path
+        The path to the repository to check.
 
     Returns
     -------
     bool
         True if any stashes exist, False otherwise.
     """
-    return len(repo.stash("list")) > 0
+    return len(run_git(repo_path, "stash", "list")) > 0
 
 
-def restore_stashed_changes(repo: git.Git, options: GitOptions | None = None) -> None:
+def restore_stashed_changes(repo_path: Path, options: GitOptions | None = None) -> None:
     """
     Restore (pop) stashed changes in the repository.
 
     Parameters
     ----------
-    repo : git.Git
-        The repository to restore stashed changes from.
+    repo_path : Path
+        The path to the repository to restore stashed changes from.
     options : GitOptions, optional
         Options for the git operation, by default None
     """
@@ -153,22 +144,21 @@ def restore_stashed_changes(repo: git.Git, options: GitOptions | None = None) ->
     console = options.console
     verbose = options.verbose
 
-    if not has_stashed_changes(repo):
+    if not has_stashed_changes(repo_path):
         return
 
-    result = repo.stash("pop")
+    result = run_git(repo_path, "stash", "pop")
 
     if console is None:
         return
 
-    repo_path = Path(repo.rev_parse("--show-toplevel"))
     console.print(f"[yellow]⟲[/yellow] Restored stashed changes in [bold]{repo_path.name}[/bold]")
 
     if verbose and console:
         console.print(f"[blue]ℹ[/blue] Stash pop result: {result}")
 
 
-def pull_repo(repo: git.Git, options: GitOptions | None = None) -> str:
+def pull_repo(repo_path: Path, options: GitOptions | None = None) -> str:
     """
     Pull the latest changes from the remote repository.
 
@@ -177,8 +167,8 @@ def pull_repo(repo: git.Git, options: GitOptions | None = None) -> str:
 
     Parameters
     ----------
-    repo : git.Git
-        The repository to pull changes from.
+    repo_path : Path
+        The path to the repository to pull changes from.
     options : GitOptions, optional
         Options for the git operation, by default None
 
@@ -190,13 +180,13 @@ def pull_repo(repo: git.Git, options: GitOptions | None = None) -> str:
     if options is None:
         options = GitOptions()
 
-    if not has_no_changes(repo):
-        stash_changes(repo, options)
+    if not has_no_changes(repo_path):
+        stash_changes(repo_path, options)
 
-    pull_output = repo.pull()
+    pull_output = run_git(repo_path, "pull", "--ff-only")
 
-    if has_stashed_changes(repo):
-        restore_stashed_changes(repo, options)
+    if has_stashed_changes(repo_path):
+        restore_stashed_changes(repo_path, options)
 
     return pull_output
 
@@ -217,7 +207,6 @@ def process_git_repo(repo_path: Path, options: GitOptions) -> tuple[int, int]:
     tuple[int, int]
         A tuple containing (successful_pulls, failed_pulls)
     """
-    repo = git.Git(repo_path)
     console = options.console
     verbose = options.verbose
 
@@ -233,7 +222,7 @@ def process_git_repo(repo_path: Path, options: GitOptions) -> tuple[int, int]:
             recursive=options.recursive,
         )
 
-        pull_output = pull_repo(repo, pull_options)
+        pull_output = pull_repo(repo_path, pull_options)
 
         if console:
             if verbose:
@@ -254,9 +243,9 @@ def process_git_repo(repo_path: Path, options: GitOptions) -> tuple[int, int]:
         return 0, 1
 
 
-def pull_repositories(current: Path, options: GitOptions) -> tuple[int, int]:
+def collect_git_repositories(current: Path, options: GitOptions) -> list[Path]:
     """
-    Pull all git repositories in the current path, optionally recursively.
+    Collect all git repositories in the current path, optionally recursively.
 
     Parameters
     ----------
@@ -267,15 +256,11 @@ def pull_repositories(current: Path, options: GitOptions) -> tuple[int, int]:
 
     Returns
     -------
-    tuple[int, int]
-        A tuple containing (successful_pulls, failed_pulls)
+    list[Path]
+        Paths of all git repositories found.
     """
-    successful = 0
-    failed = 0
-
     console = options.console
     verbose = options.verbose
-    recursive = options.recursive
 
     if verbose and console:
         console.print(f"[blue]ℹ[/blue] Checking path: [bold]{current}[/bold]")
@@ -283,34 +268,62 @@ def pull_repositories(current: Path, options: GitOptions) -> tuple[int, int]:
     if is_git_repository(current):
         if verbose and console:
             console.print(f"[blue]ℹ[/blue] Found git repository at [bold]{current}[/bold]")
-        s, f = process_git_repo(current, options)
-        successful += s
-        failed += f
-    else:
-        # Check immediate subdirectories
-        found_repos = False
-        subdirs = list(get_subdirectories(current))
+        return [current]
 
-        if verbose and console:
-            console.print(f"[blue]ℹ[/blue] Found {len(subdirs)} subdirectories in [bold]{current}[/bold]")
-
-        for path in subdirs:
-            if is_git_repository(path):
-                if verbose and console:
-                    console.print(f"[blue]ℹ[/blue] Found git repository at [bold]{path}[/bold]")
-                s, f = process_git_repo(path, options)
-                successful += s
-                failed += f
-                found_repos = True
-            elif recursive:
-                # Only go deeper if recursive is True
-                s, f = pull_repositories(path, options)
-                successful += s
-                failed += f
-                found_repos = found_repos or (s > 0 or f > 0)
-
-        if not found_repos and not recursive and console:
-            console.print(f"[yellow]![/yellow] No git repositories found in [bold]{current}[/bold].")
+    # Check immediate subdirectories
+    repos: list[Path] = []
+    subdirs = list(get_subdirectories(current))
+
+    if verbose and console:
+        console.print(f"[blue]ℹ[/blue] Found {len(subdirs)} subdirectories in [bold]{current}[/bold]")
+
+    for path in subdirs:
+        if is_git_repository(path):
+            if verbose and console:
+                console.print(f"[blue]ℹ[/blue] Found git repository at [bold]{path}[/bold]")
+            repos.append(path)
+        elif options.recursive:
+            # Only go deeper if recursive is True
+            repos.extend(collect_git_repositories(path, options))
+
+    return repos
+
+
+def pull_repositories(current: Path, options: GitOptions) -> tuple[int, int]:
+    """
+    Pull all git repositories in the current path, optionally recursively.
+
+    The repositories are collected first and then pulled in parallel
+    threads, since each pull mostly waits on the network.
+
+    Parameters
+    ----------
+    current : Path
+        The path to search for git repositories.
+    options : GitOptions
+        Options for the git operation.
+
+    Returns
+    -------
+    tuple[int, int]
+        A tuple containing (successful_pulls, failed_pulls)
+    """
+    repos = collect_git_repositories(current, options)
+
+    if not repos:
+        if options.console:
+            options.console.print(f"[yellow]![/yellow] No git repositories found in [bold]{current}[/bold].")
+        return 0, 0
+
+    if len(repos) == 1:
+        return process_git_repo(repos[0], options)
+
+    successful = 0
+    failed = 0
+    with ThreadPoolExecutor(max_workers=min(32, len(repos))) as executor:
+        for s, f in executor.map(lambda repo_path: process_git_repo(repo_path, options), repos):
+            successful += s
+            failed += f
 
     return successful, failed
 